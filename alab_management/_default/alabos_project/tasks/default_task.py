@@ -4,6 +4,13 @@ from pydantic import BaseModel
 from alab_management.task_view.task import BaseTask
 
 
+class DefaultTaskResult(BaseModel):
+    """The result of the default task."""
+
+    mass: float
+    temperature: float
+
+
 class DefaultTask(BaseTask):
     """The default task, refer to https://idocx.github.io/alab_management/task_definition.html for more details. #TODO."""
 
@@ -44,11 +51,4 @@ class DefaultTask(BaseTask):
         The method should return a pydantic model that defines the result of the task. The result
         will be validated using the result_specification.
         """
-
-        class DefaultTaskResult(BaseModel):
-            """The result of the default task."""
-
-            mass: float
-            temperature: float
-
         return DefaultTaskResult
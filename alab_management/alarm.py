@@ -1,6 +1,7 @@
 """The module to send alerts to the user via email or slack."""
 
 import smtplib
+import threading
 
 from retry.api import retry_call
 from slack_sdk import WebClient
@@ -82,6 +83,7 @@ class Alarm:
         self.email_password = email_password
         self.slack_bot_token = slack_bot_token
         self.slack_channel_id = slack_channel_id
+        self._slack_client = None
 
         if (
             self.email_receivers is not None
@@ -121,42 +123,54 @@ class Alarm:
         """
         self.slack_bot_token = slack_bot_token
         self.slack_channel_id = slack_channel_id
+        # one client for the lifetime of the alarm, so each notification
+        # reuses its underlying connection instead of building a new client
+        self._slack_client = WebClient(token=slack_bot_token)
         self.slack_alert = True
 
     def alert(self, message: str, category: str):
         """
         Try to alert user in all platform in format of "Category: Message".
 
+        The notifications are sent from a background thread, so callers (e.g.
+        a task requesting user input) do not block on SMTP/Slack round trips
+        and their retries.
+
         Args:
             message: The message to print in the platform
             category: The category of the message.
         """
         # if system is in simulation mode, do not send alert
         if not self.sim_mode_flag:
-            for platform in self.platforms:  # pylint: disable=consider-using-dict-items
-                message_dict = {"message": message, "category": category}
-                if self.platforms[platform]:
-                    try:
-                        # try twice to send email as it may fail due to network issue
-                        if platform == "email":
-                            retry_call(
-                                self.send_email,
-                                fkwargs=message_dict,
-                                tries=2,
-                                exceptions=Exception,
-                            )
-                        if platform == "slack":
-                            # try twice to send slack notification as it may fail due to network issue
-                            retry_call(
-                                self.send_slack_notification,
-                                fkwargs=message_dict,
-                                tries=2,
-                                exceptions=SlackApiError,
-                            )
-                    except Exception as e:
-                        print(
-                            f"Error sending alert to {platform} even after retry: {e}"
+            threading.Thread(
+                target=self._alert_sync,
+                args=(message, category),
+                daemon=True,
+            ).start()
+
+    def _alert_sync(self, message: str, category: str):
+        for platform in self.platforms:  # pylint: disable=consider-using-dict-items
+            message_dict = {"message": message, "category": category}
+            if self.platforms[platform]:
+                try:
+                    # try twice to send email as it may fail due to network issue
+                    if platform == "email":
+                        retry_call(
+                            self.send_email,
+                            fkwargs=message_dict,
+                            tries=2,
+                            exceptions=Exception,
+                        )
+                    if platform == "slack":
+                        # try twice to send slack notification as it may fail due to network issue
+                        retry_call(
+                            self.send_slack_notification,
+                            fkwargs=message_dict,
+                            tries=2,
+                            exceptions=SlackApiError,
                         )
+                except Exception as e:
+                    print(f"Error sending alert to {platform} even after retry: {e}")
 
     def send_email(self, message: str, category: str):
         """
@@ -195,8 +209,7 @@ class Alarm:
             category = "Error"
             # Automatically format to code block
             message = format_message_to_codeblock(message)
-        client = WebClient(token=self.slack_bot_token)
-        client.chat_postMessage(
+        self._slack_client.chat_postMessage(
             channel=self.slack_channel_id, text=category + ": " + message
         )
 
@@ -31,6 +31,11 @@ from typing import Any
 
 import toml
 
+# parsed + frozen configs keyed by the absolute config path. The frozen
+# config is immutable, so every AlabOSConfig instance pointing at the same
+# file can safely share one parsed copy instead of re-reading the toml file.
+_config_cache: dict[Path, FrozenDict] = {}
+
 
 def freeze_config(config_: dict[str, Any]) -> FrozenDict:
     """
@@ -74,19 +79,21 @@ class AlabOSConfig:
         if config_path is None:
             config_path = "config.toml"
 
-        try:
-            with open(config_path, encoding="utf-8") as f:
-                _config = toml.load(f)
-        except FileNotFoundError as exc:
-            raise FileNotFoundError(
-                f"Config file was not found at {config_path}."
-                "Please set your computer's environment variable 'ALABOS_CONFIG_PATH' to the path to the config file. In "
-                "absence of this environment variable, we assume there is a file named config.toml in the current "
-                "directory."
-            ) from exc
-
         self._path = Path(config_path).absolute()
-        self._config = freeze_config(_config)
+        if self._path not in _config_cache:
+            try:
+                with open(config_path, encoding="utf-8") as f:
+                    _config = toml.load(f)
+            except FileNotFoundError as exc:
+                raise FileNotFoundError(
+                    f"Config file was not found at {config_path}."
+                    "Please set your computer's environment variable 'ALABOS_CONFIG_PATH' to the path to the config file. In "
+                    "absence of this environment variable, we assume there is a file named config.toml in the current "
+                    "directory."
+                ) from exc
+            _config_cache[self._path] = freeze_config(_config)
+
+        self._config = _config_cache[self._path]
 
     def __getitem__(self, item):
         """Get the config item."""
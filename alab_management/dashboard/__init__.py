@@ -5,11 +5,13 @@ from pathlib import Path
 from flask import Flask
 from flask_cors import CORS  # type: ignore
 
-from .routes import init_app as init_app_route
-
 
 def create_app(cors=False):
     """Create app, which is a factory function to be called when serving the app."""
+    # imported here so that importing the dashboard package does not pull in
+    # the route modules, whose view lookups connect to MongoDB
+    from .routes import init_app as init_app_route
+
     app = Flask(__name__, static_folder=(Path(__file__).parent / "ui").as_posix())
     if cors:
         CORS(app)
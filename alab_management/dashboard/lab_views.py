@@ -1,13 +1,38 @@
 """This file contains a helper object to manage resources and update sample positions."""
 
-from alab_management.device_view import DeviceView
-from alab_management.experiment_view import ExperimentView
-from alab_management.sample_view import SampleView
-from alab_management.task_view import TaskView
-from alab_management.user_input import UserInputView
-
-task_view = TaskView()
-sample_view = SampleView()
-device_view = DeviceView()
-experiment_view = ExperimentView()
-user_input_view = UserInputView()
+
+def _create_view(name: str):
+    from alab_management.device_view import DeviceView
+    from alab_management.experiment_view import ExperimentView
+    from alab_management.sample_view import SampleView
+    from alab_management.task_view import TaskView
+    from alab_management.user_input import UserInputView
+
+    factories = {
+        "task_view": TaskView,
+        "sample_view": SampleView,
+        "device_view": DeviceView,
+        "experiment_view": ExperimentView,
+        "user_input_view": UserInputView,
+    }
+    return factories[name]()
+
+
+def __getattr__(name: str):
+    """Create and cache the requested view on first access (PEP 562).
+
+    The views connect to MongoDB (and declare their indexes) on construction,
+    so building all five eagerly at import time made any import of this module
+    pay for database connections it might never use.
+    """
+    if name not in (
+        "task_view",
+        "sample_view",
+        "device_view",
+        "experiment_view",
+        "user_input_view",
+    ):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    view = _create_view(name)
+    globals()[name] = view  # cache so subsequent accesses skip this hook
+    return view
@@ -42,18 +42,14 @@ def get_experiment_progress(exp_id: str):
     if experiment is None:
         return {"status": "error", "errors": "Cannot find experiment with this exp id"}
 
-    completed_task_count = 0
-    error = False
-    for task in experiment["tasks"]:
-        task_status = task_view.get_status(task_id=task["task_id"])
-        if task_status in [
-            TaskStatus.COMPLETED,
-            TaskStatus.ERROR,
-            TaskStatus.CANCELLED,
-        ]:
-            completed_task_count += 1
-        if task_status == TaskStatus.ERROR:
-            error = True
+    task_statuses = task_view.get_statuses(
+        task_ids=[task["task_id"] for task in experiment["tasks"]]
+    )
+    finished_statuses = (TaskStatus.COMPLETED, TaskStatus.ERROR, TaskStatus.CANCELLED)
+    completed_task_count = sum(
+        task_status in finished_statuses for task_status in task_statuses.values()
+    )
+    error = TaskStatus.ERROR in task_statuses.values()
 
     return completed_task_count / len(experiment["tasks"]), error
 
@@ -88,6 +84,14 @@ def query_experiment(exp_id: str):
 
     progress, error_state = get_experiment_progress(exp_id)
 
+    # fetch all the samples and tasks up front instead of one query per entry
+    samples = sample_view.get_samples(
+        [sample["sample_id"] for sample in experiment["samples"]]
+    )
+    task_entries = task_view.get_tasks(
+        [task["task_id"] for task in experiment["tasks"]]
+    )
+
     return_dict = {
         "id": str(experiment["_id"]),
         "name": experiment["name"],
@@ -96,7 +100,7 @@ def query_experiment(exp_id: str):
             {
                 "name": sample["name"],
                 "id": str(sample["sample_id"]),
-                "position": sample_view.get_sample(sample["sample_id"]).position,
+                "position": samples[sample["sample_id"]].position,
             }
             for sample in experiment["samples"]
         ],
@@ -108,7 +112,7 @@ def query_experiment(exp_id: str):
     }
 
     for task in experiment["tasks"]:
-        task_entry = task_view.get_task(task["task_id"])
+        task_entry = task_entries[task["task_id"]]
         return_dict["tasks"].append(
             {
                 "id": str(task["task_id"]),
@@ -155,8 +159,11 @@ def query_experiment_results(exp_id: str):
             }
         )
 
+    task_entries = task_view.get_tasks(
+        [task["task_id"] for task in experiment["tasks"]]
+    )
     for task in experiment["tasks"]:
-        task_entry = task_view.get_task(task["task_id"])
+        task_entry = task_entries[task["task_id"]]
         return_dict["tasks"].append(
             {
                 "type": task["type"],
@@ -1,3 +1,6 @@
+import time
+from typing import Any
+
 from flask import Blueprint
 
 from alab_management.dashboard.lab_views import (
@@ -9,6 +12,13 @@ from alab_management.dashboard.lab_views import (
 
 status_bp = Blueprint("/status", __name__, url_prefix="/api/status")
 
+# The status endpoint is polled by every open dashboard page and walks the
+# devices, samples and running experiments on each call. A short-lived cache
+# keeps concurrent viewers from multiplying that load while staying well
+# within the dashboard's refresh interval.
+_STATUS_CACHE_TTL = 1.0  # seconds
+_status_cache: dict[str, Any] = {"expires_at": 0.0, "payload": None}
+
 
 def parse_device_status(task_status: str, pause_status: str) -> str:
     if pause_status == "PAUSED":
@@ -22,6 +32,12 @@ def parse_device_status(task_status: str, pause_status: str) -> str:
 @status_bp.route("/")
 def get_all_status():
     """Get all the status in the database."""
+    if (
+        _status_cache["payload"] is not None
+        and time.monotonic() < _status_cache["expires_at"]
+    ):
+        return _status_cache["payload"]
+
     devices = device_view.get_all()
     devices = [
         {
@@ -58,7 +74,17 @@ def get_all_status():
     #     for request in user_input_requests
     # ]
 
-    experiments = experiment_view.get_experiments_with_status("RUNNING")
+    # materialize the cursor, since the entries are iterated twice below
+    experiments = list(experiment_view.get_experiments_with_status("RUNNING"))
+    # one batched status query for all tasks across all running experiments,
+    # instead of one query per task
+    task_statuses = task_view.get_statuses(
+        task_ids=[
+            task["task_id"]
+            for experiment in experiments
+            for task in experiment["tasks"]
+        ]
+    )
     experiments = [
         {
             "id": str(experiment["_id"]),
@@ -70,7 +96,7 @@ def get_all_status():
             "tasks": [
                 {
                     "id": str(task["task_id"]),
-                    "status": task_view.get_status(task["task_id"]).name,
+                    "status": task_statuses[task["task_id"]].name,
                     "type": task["type"],
                 }
                 for task in experiment["tasks"]
@@ -79,8 +105,11 @@ def get_all_status():
         for experiment in experiments
     ]
 
-    return {
+    payload = {
         "devices": devices,
         "experiments": experiments,
         # "userinputrequests": user_input_requests,
     }
+    _status_cache["payload"] = payload
+    _status_cache["expires_at"] = time.monotonic() + _STATUS_CACHE_TTL
+    return payload
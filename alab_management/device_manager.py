@@ -8,7 +8,7 @@ DeviceManager class, which will handle all the request to run certain methods on
 
 import time
 from collections.abc import Callable
-from concurrent.futures import Future
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from enum import Enum, auto
 from functools import partial
@@ -30,9 +30,20 @@ from .utils.data_objects import get_rabbitmq_connection
 from .utils.module_ops import load_definition
 
 DEFAULT_SERVER_QUEUE_SUFFIX = ".device_rpc"
+# size of the RPC worker pool; also bounds the broker prefetch window
+RPC_WORKER_COUNT = 16
 DEFAULT_CLIENT_QUEUE_SUFFIX = DEFAULT_SERVER_QUEUE_SUFFIX + ".reply_to"
 
 
+def get_rpc_queue_name() -> str:
+    """Build the RPC queue name shared by DeviceManager and DevicesClient."""
+    config = AlabOSConfig()
+    name = config["general"]["name"]
+    if config.is_sim_mode():
+        name += "_sim"
+    return name + DEFAULT_SERVER_QUEUE_SUFFIX
+
+
 class MethodCallStatus(Enum):
     """The status of a method call."""
 
@@ -87,6 +98,8 @@ class DeviceWrapper:
         ) = _raise
 
     def __init__(self, name: str, devices_client: "DevicesClient"):
+        # set before anything else so __getattr__ never recurses on it
+        self._method_wrappers: dict[str, DeviceWrapper.DeviceMethodWrapper] = {}
         self._name = name
         self._devices_client = devices_client
 
@@ -96,12 +109,19 @@ class DeviceWrapper:
         return self._name
 
     def __getattr__(self, method: str):
-        """Get the method."""
-        return self.DeviceMethodWrapper(
-            device_name=self.name,
-            method=method,
-            method_handler=partial(self._devices_client.call, self.name, method),
-        )
+        """Get the method. Wrappers are cached so repeated calls to the same
+        method in a task loop do not rebuild the wrapper and partial each time.
+        """
+        try:
+            return self._method_wrappers[method]
+        except KeyError:
+            wrapper = self.DeviceMethodWrapper(
+                device_name=self.name,
+                method=method,
+                method_handler=partial(self._devices_client.call, self.name, method),
+            )
+            self._method_wrappers[method] = wrapper
+            return wrapper
 
 
 class DeviceManager:
@@ -118,17 +138,15 @@ class DeviceManager:
         """
         load_definition()
         self.sim_mode_flag = AlabOSConfig().is_sim_mode()
-        if self.sim_mode_flag:
-            self._rpc_queue_name = (
-                AlabOSConfig()["general"]["name"] + "_sim" + DEFAULT_SERVER_QUEUE_SUFFIX
-            )
-        else:
-            self._rpc_queue_name = (
-                AlabOSConfig()["general"]["name"] + DEFAULT_SERVER_QUEUE_SUFFIX
-            )
+        self._rpc_queue_name = get_rpc_queue_name()
         self._device_view = DeviceView(connect_to_devices=True)
         self._check_status = _check_status
-        self.threads = []
+        # a bounded worker pool instead of one unpooled thread per message:
+        # threads are reused across commands and the old ever-growing thread
+        # list is gone
+        self._executor = ThreadPoolExecutor(
+            max_workers=RPC_WORKER_COUNT, thread_name_prefix="device_rpc"
+        )
 
     def refresh_devices(self):
         """Re-connect the devices in the device view."""
@@ -160,6 +178,10 @@ class DeviceManager:
                 auto_delete=True,
                 exclusive=False,
             )
+            # keep unacked deliveries bounded to the worker pool size so the
+            # broker does not flood this consumer with more commands than the
+            # executor can run
+            channel.basic_qos(prefetch_count=RPC_WORKER_COUNT)
             channel.basic_consume(
                 queue=self._rpc_queue_name,
                 on_message_callback=self.on_message,
@@ -194,19 +216,20 @@ class DeviceManager:
                         correlation_id=props.correlation_id,
                         content_type="application/python-dill",
                     ),
-                    body=dill.dumps(response),
+                    body=dill.dumps(response, protocol=dill.HIGHEST_PROTOCOL),
                 )
 
             channel.basic_ack(delivery_tag=cast(int, delivery_tag))
 
         try:
+            task_object_id = ObjectId(task_id)
             device_entry: dict[str, Any] | None = self._device_view.get_device(device)
 
             # check if the device is currently occupied by this task
             if self._check_status and (
                 device_entry is None
                 or device_entry["status"] != DeviceTaskStatus.OCCUPIED.name
-                or device_entry["task_id"] != ObjectId(task_id)
+                or device_entry["task_id"] != task_object_id
             ):
                 if device_entry is None:
                     raise PermissionError("There is no such device in the device view.")
@@ -223,7 +246,7 @@ class DeviceManager:
                         raise PermissionError(
                             f"Currently the device ({device}) is NOT OCCUPIED, it is currently in status {device_entry['status']}"
                         )
-                if device_entry["task_id"] != ObjectId(task_id):
+                if device_entry["task_id"] != task_object_id:
                     device_task_id = str(device_entry["task_id"])
                     raise PermissionError(
                         f"Currently the task ({task_id}) "
@@ -262,21 +285,17 @@ class DeviceManager:
         """
         body: dict[str, Any] = dill.loads(_body)
 
-        thread = Thread(
-            target=self._execute_command_wrapper,
-            args=(
-                channel,
-                method.delivery_tag,
-                props,
-                body["device"],
-                body["method"],
-                body["task_id"],
-                *body["args"],
-            ),
-            kwargs=body["kwargs"],
+        self._executor.submit(
+            self._execute_command_wrapper,
+            channel,
+            method.delivery_tag,
+            props,
+            body["device"],
+            body["method"],
+            body["task_id"],
+            *body["args"],
+            **body["kwargs"],
         )
-        self.threads.append(thread)
-        thread.start()
 
 
 class DevicesClient:  # pylint: disable=too-many-instance-attributes
@@ -297,14 +316,7 @@ class DevicesClient:  # pylint: disable=too-many-instance-attributes
         assert task_id is not None, "task_id cannot be None!"
 
         self.sim_mode_flag = AlabOSConfig().is_sim_mode()
-        if self.sim_mode_flag:
-            self._rpc_queue_name = (
-                AlabOSConfig()["general"]["name"] + "_sim" + DEFAULT_SERVER_QUEUE_SUFFIX
-            )
-        else:
-            self._rpc_queue_name = (
-                AlabOSConfig()["general"]["name"] + DEFAULT_SERVER_QUEUE_SUFFIX
-            )
+        self._rpc_queue_name = get_rpc_queue_name()
         # self._rpc_reply_queue_name = ( str(task_id) + DEFAULT_CLIENT_QUEUE_SUFFIX )  # TODO does this have to be
         #  taskid, or can be random? I think this dies with the resourcerequest context manager anyways?
         self._rpc_reply_queue_name = str(uuid4()) + DEFAULT_CLIENT_QUEUE_SUFFIX
@@ -379,8 +391,13 @@ class DevicesClient:  # pylint: disable=too-many-instance-attributes
                         "method": method,
                         "args": args,
                         "kwargs": kwargs,
-                        "task_id": str(self._task_id),
-                    }
+                        # sent as a raw ObjectId: dill handles it natively and
+                        # the server-side ObjectId() call accepts either form
+                        "task_id": self._task_id,
+                    },
+                    # the newest pickle protocol gives smaller, faster frames;
+                    # both ends of this RPC run the same codebase
+                    protocol=dill.HIGHEST_PROTOCOL,
                 ),
                 properties=BasicProperties(
                     reply_to=self._rpc_reply_queue_name,
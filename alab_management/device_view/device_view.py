@@ -59,6 +59,13 @@ class DeviceView:
         self._device_collection = get_collection("devices")
         self._device_collection.create_index([("name", pymongo.HASHED)])
         self._device_list = get_all_devices()
+        # device type name -> device names, so existence checks during resource
+        # requests are dict lookups instead of database queries
+        self._device_names_by_type: dict[str, set[str]] = {}
+        for device in self._device_list.values():
+            self._device_names_by_type.setdefault(
+                device.__class__.__name__, set()
+            ).add(device.name)
         self._lock = get_lock(self._device_collection.name)
         self.__connected_to_devices = False
         self._sample_view = SampleView()
@@ -211,11 +218,8 @@ class DeviceView:
                     # if no device is held by the same task, pick the device with least samples
                     minimum_number_of_samples = 999999999
                     for device_ in result:
-                        samples_on_device_ = self._sample_view.get_samples_on_device(
-                            device_["name"]
-                        )
-                        number_of_samples_in_device_ = sum(
-                            len(samples) for samples in samples_on_device_.values()
+                        number_of_samples_in_device_ = (
+                            self._sample_view.count_samples_on_device(device_["name"])
                         )
                         if number_of_samples_in_device_ < minimum_number_of_samples:
                             minimum_number_of_samples = number_of_samples_in_device_
@@ -259,12 +263,14 @@ class DeviceView:
             request_dict = {
                 "type": device_str,
             }
+            known_device = device_str in self._device_names_by_type
         elif type_or_name == "name":
             request_dict = {"name": device_str}
+            known_device = device_str in self._device_list
         else:
             raise ValueError(f"Unknown type_or_name: {type_or_name}")
 
-        if self._device_collection.find_one(request_dict) is None:
+        if not known_device:
             raise ValueError(f"No such device of {type_or_name} {device_str}")
 
         request_dict.update(
@@ -290,7 +296,11 @@ class DeviceView:
                 # this request. Will be released by the older request.
                 "need_release": device_entry["task_id"] != task_id,
             }
-            for device_entry in self._device_collection.find(request_dict)
+            # only the name and task_id are needed here, so we avoid pulling
+            # the full device document (descriptions, sample positions, attributes)
+            for device_entry in self._device_collection.find(
+                request_dict, projection=["name", "task_id"]
+            )
         ]
 
     def get_device(self, device_name: str) -> dict[str, Any]:
@@ -307,19 +317,21 @@ class DeviceView:
 
     def occupy_device(self, device: BaseDevice | str, task_id: ObjectId):
         """Occupy a device with given task id."""
-        self._update_status(
+        updated_entry = self._update_status(
             device=device,
             required_status=DeviceTaskStatus.IDLE,
             target_status=DeviceTaskStatus.OCCUPIED,
             task_id=task_id,
         )
         device_name = device.name if isinstance(device, BaseDevice) else device
-        # Wait until the device status has been updated to OCCUPIED
+        # the update returns the post-update document, so in the normal case no
+        # extra confirmation query is needed
         while (
-            self.get_status(device_name=device_name).name
-            != DeviceTaskStatus.OCCUPIED.name
+            updated_entry is None
+            or updated_entry["status"] != DeviceTaskStatus.OCCUPIED.name
         ):
             time.sleep(0.5)
+            updated_entry = self._device_collection.find_one({"name": device_name})
 
     def get_devices_by_task(self, task_id: ObjectId | None) -> list[BaseDevice]:
         """Get devices given a task id (regardless of its status!)."""
@@ -352,13 +364,16 @@ class DeviceView:
                 }
             )
 
-        self._device_collection.update_one(
+        updated_entry = self._device_collection.find_one_and_update(
             {"name": device_name},
             {"$set": update_dict},
+            return_document=pymongo.ReturnDocument.AFTER,
         )
-        # wait until the device status has been updated to IDLE
-        while self.get_status(device_name=device_name).name != "IDLE":
+        # the update returns the post-update document, so in the normal case no
+        # extra confirmation query is needed
+        while updated_entry is None or updated_entry["status"] != "IDLE":
             time.sleep(0.5)
+            updated_entry = self._device_collection.find_one({"name": device_name})
 
     def _update_status(
         self,
@@ -366,43 +381,36 @@ class DeviceView:
         required_status: DeviceTaskStatus | list[DeviceTaskStatus] | None,
         target_status: DeviceTaskStatus,
         task_id: ObjectId | None,
-    ):
+    ) -> dict[str, Any] | None:
         """
         A method that check and update the status of a device.
 
         If ``task_id`` is the same as the task id in queried sample,
         we will just skip the status check specified by ``required_status``
+
+        Returns the device entry after the update.
         """
         device_name = device.name if isinstance(device, BaseDevice) else device
 
-        device_entry = self._device_collection.find_one({"name": device_name})
-
-        if device_entry is None:
-            raise ValueError(
-                f"Cannot find device ({device_name}). Did you run `setup` command?"
-            )
-
         required_status = (
             [required_status]
             if isinstance(required_status, DeviceTaskStatus)
             else required_status
         )
 
-        # if task_id has the same value, we will not check the current status
-        if device_entry["task_id"] == task_id:
-            required_status = None
-
-        if (
-            required_status is not None
-            and DeviceTaskStatus[device_entry["status"]] not in required_status
-        ):
-            raise ValueError(
-                f"Device's current status ({device_entry['status']}) is "
-                f"not in allowed set of statuses {[status.name for status in required_status]}. "
-                f"Cannot change status to {target_status.name}"
-            )
-        self._device_collection.update_one(
-            {"name": device_name},
+        # the status precondition is part of the update filter, so checking and
+        # updating happen atomically in a single compare-and-set instead of a
+        # racy read-then-write
+        query: dict[str, Any] = {"name": device_name}
+        if required_status is not None:
+            query["$or"] = [
+                {"status": {"$in": [status.name for status in required_status]}},
+                # if task_id has the same value, we will not check the current status
+                {"task_id": task_id},
+            ]
+
+        updated_entry = self._device_collection.find_one_and_update(
+            query,
             {
                 "$set": {
                     "status": target_status.name,
@@ -410,7 +418,20 @@ class DeviceView:
                     "last_updated": datetime.now(),
                 }
             },
+            return_document=pymongo.ReturnDocument.AFTER,
         )
+        if updated_entry is None:
+            device_entry = self._device_collection.find_one({"name": device_name})
+            if device_entry is None:
+                raise ValueError(
+                    f"Cannot find device ({device_name}). Did you run `setup` command?"
+                )
+            raise ValueError(
+                f"Device's current status ({device_entry['status']}) is "
+                f"not in allowed set of statuses {[status.name for status in required_status]}. "
+                f"Cannot change status to {target_status.name}"
+            )
+        return updated_entry
 
     def query_property(self, device_name: str, prop: str):
         """
@@ -581,14 +602,70 @@ class DeviceView:
         return [device["name"] for device in paused_devices]
 
     def pause_all_devices(self):
-        """Pause all devices."""
-        for device in self._device_list.values():
-            self.pause_device(device.name)
+        """Pause all devices.
+
+        Mirrors :py:meth:`pause_device` but with two bulk updates (idle devices
+        go straight to PAUSED, busy ones to REQUESTED) instead of two queries
+        per device.
+        """
+        device_names = [device.name for device in self._device_list.values()]
+        now = datetime.now()
+        self._device_collection.update_many(
+            {"name": {"$in": device_names}, "status": DeviceTaskStatus.IDLE.name},
+            {
+                "$set": {
+                    "pause_status": DevicePauseStatus.PAUSED.name,
+                    "last_updated": now,
+                }
+            },
+        )
+        self._device_collection.update_many(
+            {
+                "name": {"$in": device_names},
+                "status": {"$ne": DeviceTaskStatus.IDLE.name},
+            },
+            {
+                "$set": {
+                    "pause_status": DevicePauseStatus.REQUESTED.name,
+                    "last_updated": now,
+                }
+            },
+        )
 
     def unpause_all_devices(self):
-        """Unpause all devices."""
-        for device in self._device_list.values():
-            self.unpause_device(device.name)
+        """Unpause all devices.
+
+        Mirrors :py:meth:`unpause_device` but with two bulk updates: paused
+        devices also get their task status reset to IDLE, while devices whose
+        pause was only requested keep their task status.
+        """
+        device_names = [device.name for device in self._device_list.values()]
+        now = datetime.now()
+        self._device_collection.update_many(
+            {
+                "name": {"$in": device_names},
+                "pause_status": DevicePauseStatus.PAUSED.name,
+            },
+            {
+                "$set": {
+                    "pause_status": DevicePauseStatus.RELEASED.name,
+                    "status": DeviceTaskStatus.IDLE.name,
+                    "last_updated": now,
+                }
+            },
+        )
+        self._device_collection.update_many(
+            {
+                "name": {"$in": device_names},
+                "pause_status": {"$ne": DevicePauseStatus.RELEASED.name},
+            },
+            {
+                "$set": {
+                    "pause_status": DevicePauseStatus.RELEASED.name,
+                    "last_updated": now,
+                }
+            },
+        )
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Disconnect from all devices when exiting the context manager."""
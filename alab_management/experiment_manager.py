@@ -13,7 +13,7 @@ from .config import AlabOSConfig
 from .experiment_view import CompletedExperimentView, ExperimentStatus, ExperimentView
 from .logger import DBLogger
 from .sample_view import SampleView
-from .task_view import TaskStatus, TaskView
+from .task_view import TaskView
 from .utils.graph_ops import Graph
 
 
@@ -77,20 +77,13 @@ class ExperimentManager:
         tasks: list[dict[str, Any]] = experiment["tasks"]
 
         # check if there is any cycle in the graph
-        reversed_edges = {i: task["prev_tasks"] for i, task in enumerate(tasks)}
-        task_graph = Graph(
-            list(range(len(tasks))),
-            # reverse reserved edges to get right directions of edges
-            {
-                i: [
-                    j
-                    for j, children in reversed_edges.items()
-                    for child in children
-                    if child == i
-                ]
-                for i in list(range(len(tasks)))
-            },
-        )
+        # build the parent -> children adjacency in one pass over the
+        # prev_tasks lists instead of rescanning them for every vertex
+        edges: dict[int, list[int]] = {i: [] for i in range(len(tasks))}
+        for child, task in enumerate(tasks):
+            for parent in task["prev_tasks"]:
+                edges[parent].append(child)
+        task_graph = Graph(list(range(len(tasks))), edges)
         if task_graph.has_cycle():
             self.experiment_view.update_experiment_status(
                 experiment["_id"], ExperimentStatus.ERROR
@@ -130,12 +123,16 @@ class ExperimentManager:
 
         # add dependency to each task
         for task_id in task_ids:
+            prev_tasks = task_graph.get_parents(task_id)
             self.task_view.update_task_dependency(
                 task_id,
                 next_tasks=task_graph.get_children(task_id),
-                prev_tasks=task_graph.get_parents(task_id),
+                prev_tasks=prev_tasks,
             )
-            self.task_view.try_to_mark_task_ready(task_id)
+            # only root tasks can be ready at submission time; the others
+            # become ready when their parents complete
+            if not prev_tasks:
+                self.task_view.try_to_mark_task_ready(task_id)
 
         # write back the assign task & sample ids
         self.experiment_view.update_sample_task_id(
@@ -151,22 +148,27 @@ class ExperimentManager:
 
     def mark_completed_experiments(self):
         """This method will scan the database to mark completed experiments in time."""
-        running_experiments = self.experiment_view.get_experiments_with_status(
-            ExperimentStatus.RUNNING
+        # materialize the cursor: the experiments are iterated once to gather
+        # task ids and a second time to check each experiment
+        running_experiments = list(
+            self.experiment_view.get_experiments_with_status(
+                ExperimentStatus.RUNNING
+            )
+        )
+        # one aggregate query over the tasks of every running experiment,
+        # instead of a status lookup per experiment per tick
+        unfinished_task_ids = self.task_view.get_unfinished_task_ids(
+            task_ids=[
+                task["task_id"]
+                for experiment in running_experiments
+                for task in experiment["tasks"]
+            ]
         )
         for experiment in running_experiments:
             task_ids = [task["task_id"] for task in experiment["tasks"]]
 
             # if all the tasks of an experiment have been finished
-            if all(
-                self.task_view.get_status(task_id=task_id)
-                in {
-                    TaskStatus.COMPLETED,
-                    TaskStatus.ERROR,
-                    TaskStatus.CANCELLED,
-                }
-                for task_id in task_ids
-            ):
+            if all(task_id not in unfinished_task_ids for task_id in task_ids):
                 self.experiment_view.update_experiment_status(
                     exp_id=experiment["_id"], status=ExperimentStatus.COMPLETED
                 )
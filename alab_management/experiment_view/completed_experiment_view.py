@@ -35,11 +35,12 @@ class CompletedExperimentView:
                 f"Experiment with id {experiment_id} does not exist in the working database!"
             )
 
-        for sample in experiment_dict["samples"]:
-            self.completed_sample_view.save_sample(sample_id=sample["sample_id"])
-
-        for task in experiment_dict["tasks"]:
-            self.completed_task_view.save_task(task_id=task["task_id"])
+        self.completed_sample_view.save_samples(
+            [sample["sample_id"] for sample in experiment_dict["samples"]]
+        )
+        self.completed_task_view.save_tasks(
+            [task["task_id"] for task in experiment_dict["tasks"]]
+        )
 
         if self.exists(experiment_id):
             self._completed_experiment_collection.update_one(
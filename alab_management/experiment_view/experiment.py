@@ -5,12 +5,18 @@ from typing import Any
 from bson import BSON, ObjectId  # type: ignore
 from pydantic import (
     BaseModel,
+    ConfigDict,
     Field,
     field_validator,
 )
 
+# an experiment request is a value object: nothing should rewrite its fields
+# after validation, so all the models below are frozen
+
 
 class _Sample(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(pattern=r"^[^$.]+$")
     sample_id: str | None = None
     tags: list[str]
@@ -43,6 +49,8 @@ class _Sample(BaseModel):
 
 
 class _Task(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     type: str
     parameters: dict[str, Any]
     prev_tasks: list[int]
@@ -78,6 +86,8 @@ class _Task(BaseModel):
 class InputExperiment(BaseModel):
     """This is the format that user should follow to write to experiment database."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(pattern=r"^[^$.]+$")
     samples: list[_Sample]
     tasks: list[_Task]
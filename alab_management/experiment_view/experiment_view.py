@@ -35,6 +35,13 @@ class ExperimentView:
 
     def __init__(self):
         self._experiment_collection = get_collection("experiment")
+        # multikey indexes into the embedded task/sample arrays, which back
+        # get_experiment_by_task_id / get_experiment_by_sample_id
+        self._experiment_collection.create_index([("tasks.task_id", 1)])
+        self._experiment_collection.create_index([("samples.sample_id", 1)])
+        # the experiment manager polls PENDING/RUNNING experiments by status
+        # on every tick; without this index each poll scans the collection
+        self._experiment_collection.create_index([("status", 1)])
         self.sample_view = SampleView()
         self.task_view = TaskView()
         self.completed_experiment_view = CompletedExperimentView()
@@ -6,6 +6,7 @@ from enum import Enum, auto, unique
 from typing import Any, cast
 
 from bson import ObjectId
+from pymongo import WriteConcern
 
 from .utils.data_objects import get_collection
 
@@ -39,12 +40,29 @@ class DBLogger:
     def __init__(self, task_id: ObjectId | None):
         self.task_id = task_id
         self._logging_collection = get_collection("logs")
+        # the logs collection grows without bound, so the dashboard/monitoring
+        # queries need indexes to avoid scanning the whole history
+        self._logging_collection.create_index([("level", 1), ("created_at", 1)])
+        self._logging_collection.create_index(
+            [
+                ("type", 1),
+                ("log_data.device_name", 1),
+                ("log_data.signal_name", 1),
+                ("created_at", -1),
+            ]
+        )
+        # unacknowledged writes for high-rate telemetry: device signals are
+        # fire-and-forget, so the caller does not wait for a server round trip
+        self._unacked_logging_collection = self._logging_collection.with_options(
+            write_concern=WriteConcern(w=0)
+        )
 
     def log(
         self,
         level: str | int | LoggingLevel,
         log_data: dict[str, Any],
         logging_type: LoggingType = LoggingType.OTHER,
+        acknowledged: bool = True,
     ) -> ObjectId:
         """
         Basic log function.
@@ -53,13 +71,20 @@ class DBLogger:
             level: the level of this log, which can be string, int or :py:class:`LoggingLevel <LoggingLevel>`
             log_data: the data to be logged
             logging_type: the type of logging.
+            acknowledged: whether to wait for the server to acknowledge the
+              write. High-rate telemetry can pass False to log fire-and-forget.
         """
         if isinstance(level, str):
             level = LoggingLevel[level].value
         elif isinstance(level, LoggingLevel):
             level = level.value
 
-        result = self._logging_collection.insert_one(
+        collection = (
+            self._logging_collection
+            if acknowledged
+            else self._unacked_logging_collection
+        )
+        result = collection.insert_one(
             {
                 "task_id": self.task_id,
                 "type": logging_type.name,
@@ -97,6 +122,7 @@ class DBLogger:
                 "signal_value": signal_value,
             },
             logging_type=LoggingType.DEVICE_SIGNAL,
+            acknowledged=False,
         )
 
     def system_log(self, level: str | int | LoggingLevel, log_data: dict[str, Any]):
@@ -46,6 +46,12 @@ class ResourceManager(RequestMixin):
         self.sample_view = SampleView()
         self.device_view = DeviceView()
         self._request_collection = get_collection("requests")
+        # supports the pending-request scan, which filters on status and sorts
+        # by (priority desc, submitted_at asc); also covers the status-only
+        # lookups in the release path
+        self._request_collection.create_index(
+            [("status", 1), ("priority", -1), ("submitted_at", 1)]
+        )
 
         self._pause_resource_assigning = False
 
@@ -67,16 +73,21 @@ class ResourceManager(RequestMixin):
     def run(self):
         """Start the loop."""
         while True:
-            self._loop()
-            time.sleep(0.5)
+            handled_any = self._loop()
+            # only back off when the last pass was idle, so that a burst of
+            # requests is drained at full speed instead of one per sleep tick
+            if not handled_any:
+                time.sleep(0.5)
 
-    def _loop(self):
-        self.handle_released_resources()
+    def _loop(self) -> bool:
+        handled_any = self.handle_released_resources()
         if not self._pause_resource_assigning:
-            self.handle_requested_resources()
+            handled_any = self.handle_requested_resources() or handled_any
+        return handled_any
 
-    def handle_released_resources(self):
-        """Release the resources."""
+    def handle_released_resources(self) -> bool:
+        """Release the resources. Returns whether any request was released."""
+        released_any = False
         for request in self.get_requests_by_status(RequestStatus.NEED_RELEASE):
             devices = request["assigned_devices"]
             sample_positions = request["assigned_sample_positions"]
@@ -87,31 +98,51 @@ class ResourceManager(RequestMixin):
                 status=RequestStatus.RELEASED,
                 original_status=RequestStatus.NEED_RELEASE,
             )
+            released_any = True
+        return released_any
 
-    def handle_requested_resources(self):
+    def handle_requested_resources(self) -> bool:
         """
         Check if there are any requests that are in PENDING status. If so,
         try to assign the resources to it.
+
+        Returns whether any request changed status during this pass.
         """
-        requests = list(self.get_requests_by_status(RequestStatus.PENDING))
-        # prioritize the oldest requests at the highest priority value
-        requests.sort(key=lambda x: x["submitted_at"])
-        requests.sort(key=lambda x: x["priority"], reverse=True)
+        # prioritize the oldest requests at the highest priority value,
+        # sorted server-side so the batch arrives ready to process
+        requests = self.get_requests_by_status(RequestStatus.PENDING).sort(
+            [("priority", -1), ("submitted_at", 1)]
+        )
+        # the set of tasks being canceled only needs to be queried once per pass,
+        # not once per pending request
+        canceling_task_ids = self.task_view.get_task_ids_to_be_canceled(
+            canceling_progress=CancelingProgress.WORKER_NOTIFIED
+        )
+        handled_any = False
         for request in requests:
-            self._handle_requested_resources(request)
+            handled_any = (
+                self._handle_requested_resources(
+                    request, canceling_task_ids=canceling_task_ids
+                )
+                or handled_any
+            )
+        return handled_any
 
-    def _handle_requested_resources(self, request_entry: dict[str, Any]):
+    def _handle_requested_resources(
+        self,
+        request_entry: dict[str, Any],
+        canceling_task_ids: set[ObjectId] | None = None,
+    ) -> bool:
         try:
             resource_request = request_entry["request"]
             task_id = request_entry["task_id"]
 
-            task_status = self.task_view.get_status(task_id=task_id)
-            if task_status != TaskStatus.REQUESTING_RESOURCES or task_id in {
-                task["task_id"]
-                for task in self.task_view.get_tasks_to_be_canceled(
+            if canceling_task_ids is None:
+                canceling_task_ids = self.task_view.get_task_ids_to_be_canceled(
                     canceling_progress=CancelingProgress.WORKER_NOTIFIED
                 )
-            }:
+            task_status = self.task_view.get_status(task_id=task_id)
+            if task_status != TaskStatus.REQUESTING_RESOURCES or task_id in canceling_task_ids:
                 # this implies the Task has been cancelled or errored somewhere else in the chain -- we should
                 # not allocate any resources to the broken Task.
                 self.update_request_status(
@@ -119,25 +150,26 @@ class ResourceManager(RequestMixin):
                     status=RequestStatus.CANCELED,
                     original_status=RequestStatus.PENDING,
                 )
-                return
+                return True
+
+            # collect the requested device names and types in a single pass
+            device_names_str: list[str] = []
+            device_types_str: list[str] = []
+            for entry in resource_request:
+                if entry["device"]["identifier"] == "name":
+                    device_names_str.append(entry["device"]["content"])
+                elif entry["device"]["identifier"] == "type":
+                    device_types_str.append(entry["device"]["content"])
 
             devices = self.device_view.request_devices(
                 task_id=task_id,
-                device_names_str=[
-                    entry["device"]["content"]
-                    for entry in resource_request
-                    if entry["device"]["identifier"] == "name"
-                ],
-                device_types_str=[
-                    entry["device"]["content"]
-                    for entry in resource_request
-                    if entry["device"]["identifier"] == "type"
-                ],
+                device_names_str=device_names_str,
+                device_types_str=device_types_str,
             )
             # some devices are not available now
             # the request cannot be fulfilled
             if devices is None:
-                return
+                return False
 
             # replace device placeholder in sample position request
             # and make it into a single list
@@ -154,25 +186,28 @@ class ResourceManager(RequestMixin):
                     # if this is a nested resource request, lets not prepend the device name twice.
                     if not prefix.startswith(device_prefix):
                         prefix = device_prefix + prefix
+                    # the request was already validated by ResourcesRequest on
+                    # submission, so skip pydantic revalidation in this hot loop
                     parsed_sample_positions_request.append(
-                        SamplePositionRequest(prefix=prefix, number=pos["number"])
+                        SamplePositionRequest.model_construct(
+                            prefix=prefix, number=pos["number"]
+                        )
                     )
 
-            self._request_collection.update_one(
-                {"_id": request_entry["_id"]},
-                {
-                    "$set": {
-                        "parsed_sample_positions_request": [
-                            dict(spr) for spr in parsed_sample_positions_request
-                        ]
-                    }
-                },
-            )
+            # only write the parsed request back when it changed (it depends on
+            # which devices were matched); unconditional writes re-stored the
+            # same payload on every retry of an unfulfillable request
+            parsed_request_dicts = [dict(spr) for spr in parsed_sample_positions_request]
+            if request_entry.get("parsed_sample_positions_request") != parsed_request_dicts:
+                self._request_collection.update_one(
+                    {"_id": request_entry["_id"]},
+                    {"$set": {"parsed_sample_positions_request": parsed_request_dicts}},
+                )
             sample_positions = self.sample_view.request_sample_positions(
                 task_id=task_id, sample_positions=parsed_sample_positions_request
             )
             if sample_positions is None:
-                return
+                return False
 
         # in case some errors happen, we will raise the error in the task process instead of the main process
         except Exception as error:  # pylint: disable=broad-except
@@ -194,36 +229,39 @@ class ResourceManager(RequestMixin):
                     f"Error updating request {request_entry['_id']}: cannot update the request status from PENDING "
                     f"to ERROR."
                 ) from error
-            return
+            return True
 
         # if both devices and sample positions can be satisfied
         request_entry = self._request_collection.find_one(
             {"_id": request_entry["_id"], "status": RequestStatus.PENDING.name}
         )
 
-        if request_entry is not None:
-            # label the resources as occupied
-            self._occupy_devices(devices=devices, task_id=task_id)
-            self._occupy_sample_positions(
-                sample_positions=sample_positions, task_id=task_id
-            )
+        if request_entry is None:
+            return False
 
-            returned_value = self._request_collection.update_one(
-                {"_id": request_entry["_id"], "status": RequestStatus.PENDING.name},
-                {
-                    "$set": {
-                        "assigned_devices": devices,
-                        "assigned_sample_positions": sample_positions,
-                        "status": RequestStatus.FULFILLED.name,
-                        "fulfilled_at": datetime.now(),
-                    }
-                },
-            )
+        # label the resources as occupied
+        self._occupy_devices(devices=devices, task_id=task_id)
+        self._occupy_sample_positions(
+            sample_positions=sample_positions, task_id=task_id
+        )
 
-            # if the request status cannot be updated (due to status change), release the resources
-            if returned_value.modified_count != 1:
-                self._release_devices(devices)
-                self._release_sample_positions(sample_positions)
+        returned_value = self._request_collection.update_one(
+            {"_id": request_entry["_id"], "status": RequestStatus.PENDING.name},
+            {
+                "$set": {
+                    "assigned_devices": devices,
+                    "assigned_sample_positions": sample_positions,
+                    "status": RequestStatus.FULFILLED.name,
+                    "fulfilled_at": datetime.now(),
+                }
+            },
+        )
+
+        # if the request status cannot be updated (due to status change), release the resources
+        if returned_value.modified_count != 1:
+            self._release_devices(devices)
+            self._release_sample_positions(sample_positions)
+        return True
 
     def _occupy_devices(self, devices: dict[str, dict[str, Any]], task_id: ObjectId):
         for device in devices.values():
@@ -234,11 +272,14 @@ class ResourceManager(RequestMixin):
     def _occupy_sample_positions(
         self, sample_positions: dict[str, list[dict[str, Any]]], task_id: ObjectId
     ):
-        for sample_positions_ in sample_positions.values():
-            for sample_position_ in sample_positions_:
-                self.sample_view.lock_sample_position(
-                    task_id, cast(str, sample_position_["name"])
-                )
+        self.sample_view.lock_sample_positions(
+            task_id,
+            [
+                cast(str, sample_position_["name"])
+                for sample_positions_ in sample_positions.values()
+                for sample_position_ in sample_positions_
+            ],
+        )
 
     def _release_devices(self, devices: dict[str, dict[str, Any]]):
         for device in devices.values():
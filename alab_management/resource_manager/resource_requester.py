@@ -13,7 +13,7 @@ from typing import Any, cast
 
 import dill
 from bson import ObjectId
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 from pydantic.root_model import RootModel
 
 from alab_management.device_view.device import BaseDevice
@@ -24,6 +24,20 @@ from alab_management.sample_view.sample_view import SamplePositionRequest
 from alab_management.task_view import TaskPriority
 from alab_management.utils.data_objects import DocumentNotUpdatedError, get_collection
 
+# membership checks on these run every 0.5s in the release poll loops
+_CANCELED_OR_ERROR_STATUS_NAMES = frozenset(
+    {RequestStatus.CANCELED.name, RequestStatus.ERROR.name}
+)
+# valid values for the "identifier" field of a device request
+_VALID_DEVICE_IDENTIFIERS = frozenset({"name", "type", _EXTRA_REQUEST})
+_RELEASE_TERMINAL_STATUS_NAMES = frozenset(
+    {
+        RequestStatus.RELEASED.name,
+        RequestStatus.CANCELED.name,
+        RequestStatus.ERROR.name,
+    }
+)
+
 _SampleRequestDict = dict[str, int]
 _ResourceRequestDict = dict[
     type[BaseDevice] | str | None, _SampleRequestDict
@@ -53,6 +67,10 @@ else:
 class DeviceRequest(BaseModel):
     """Pydantic model for device request."""
 
+    # requests are read-only once validated; rejecting unknown keys catches
+    # malformed requests early instead of silently dropping them
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     identifier: str
     content: str
 
@@ -60,6 +78,8 @@ class DeviceRequest(BaseModel):
 class ResourceRequestItem(BaseModel):
     """Pydantic model for resource request item."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     device: DeviceRequest
     sample_positions: list[SamplePositionRequest]
 
@@ -96,27 +116,26 @@ class ResourcesRequest(RootModel):
 
     @model_validator(mode="before")
     def preprocess(cls, values):
-        """Preprocess the request."""
-        new_values = []
+        """Preprocess the request.
+
+        Only the device identifier needs an early check here; the field-level
+        validation that follows covers the rest, so the old per-item dict
+        rebuild was pure allocation overhead.
+        """
         for request_dict in values:
-            if request_dict["device"]["identifier"] not in [
-                "name",
-                "type",
-                _EXTRA_REQUEST,
-            ]:
+            device = (
+                request_dict["device"]
+                if isinstance(request_dict, dict)
+                else request_dict.device
+            )
+            identifier = (
+                device["identifier"] if isinstance(device, dict) else device.identifier
+            )
+            if identifier not in _VALID_DEVICE_IDENTIFIERS:
                 raise ValueError(
                     f"device identifier must be one of 'name', 'type', or {_EXTRA_REQUEST}"
                 )
-            new_values.append(
-                {
-                    "device": {
-                        "identifier": request_dict["device"]["identifier"],
-                        "content": request_dict["device"]["content"],
-                    },
-                    "sample_positions": request_dict["sample_positions"],
-                }
-            )
-        return new_values
+        return values
 
 
 class RequestMixin:
@@ -245,9 +264,9 @@ class ResourceRequester(RequestMixin):
             device_str_to_request[content] = device
 
             positions = [
-                dict(SamplePositionRequest(prefix=prefix, number=number))
+                SamplePositionRequest(prefix=prefix, number=number)
                 for prefix, number in position_dict.items()
-            ]  # immediate dict conversion - SamplePositionRequest is only used to check request format.
+            ]
             formatted_resource_request.append(
                 {
                     "device": {
@@ -258,11 +277,11 @@ class ResourceRequester(RequestMixin):
                 }
             )
 
-        if not isinstance(formatted_resource_request, ResourcesRequest):
-            formatted_resource_request = ResourcesRequest(root=formatted_resource_request)  # type: ignore
-        formatted_resource_request = formatted_resource_request.model_dump(  # pylint: disable=assignment-from-no-return
-            mode="json"
-        )
+        # validate once and dump once: the position models are passed through
+        # directly instead of being dict-converted and then re-parsed
+        formatted_resource_request = ResourcesRequest(
+            root=formatted_resource_request  # type: ignore
+        ).model_dump(mode="json")
 
         result = self._request_collection.insert_one(
             {
@@ -318,7 +337,7 @@ class ResourceRequester(RequestMixin):
         """Release a request by request_id."""
         # For the requests that were CANCELED or ERROR, but have assigned resources, release them
         request = self.get_request(request_id)
-        if request["status"] in [RequestStatus.CANCELED.name, RequestStatus.ERROR.name]:
+        if request["status"] in _CANCELED_OR_ERROR_STATUS_NAMES:
             if ("assigned_devices" in request) or (
                 "assigned_sample_positions" in request
             ):
@@ -339,11 +358,10 @@ class ResourceRequester(RequestMixin):
             )
 
         # wait for the request to be released or canceled or errored during the release
-        while self.get_request(request_id, projection=["status"])["status"] not in [
-            RequestStatus.RELEASED.name,
-            RequestStatus.CANCELED.name,
-            RequestStatus.ERROR.name,
-        ]:
+        while (
+            self.get_request(request_id, projection=["status"])["status"]
+            not in _RELEASE_TERMINAL_STATUS_NAMES
+        ):
             time.sleep(0.5)
 
     def release_all_resources(self):
@@ -383,10 +401,7 @@ class ResourceRequester(RequestMixin):
         # For the requests that were CANCELED or ERROR, but have assigned resources, release them
         assigned_cancel_error_requests_id = []
         for request in self.get_requests_by_task_id(self.task_id):
-            if request["status"] in [
-                RequestStatus.CANCELED.name,
-                RequestStatus.ERROR.name,
-            ] and (
+            if request["status"] in _CANCELED_OR_ERROR_STATUS_NAMES and (
                 ("assigned_devices" in request)
                 or ("assigned_sample_positions" in request)
             ):
@@ -399,14 +414,7 @@ class ResourceRequester(RequestMixin):
 
         # wait for all the requests to be released or canceled or errored during the release
         while any(
-            (
-                request["status"]
-                not in [
-                    RequestStatus.RELEASED.name,
-                    RequestStatus.CANCELED.name,
-                    RequestStatus.ERROR.name,
-                ]
-            )
+            request["status"] not in _RELEASE_TERMINAL_STATUS_NAMES
             for request in self.get_requests_by_task_id(self.task_id)
         ):
             time.sleep(0.5)
@@ -414,8 +422,20 @@ class ResourceRequester(RequestMixin):
     def _check_request_status_loop(self):
         while not self._stop:
             try:
-                for request_id in self._waiting.copy():
-                    status = self.get_request(request_id=request_id, projection=["status"])["status"]  # type: ignore
+                waiting_request_ids = list(self._waiting)
+                if waiting_request_ids:
+                    # fetch the statuses of all waiting requests in one query
+                    # instead of one round trip per request every tick
+                    statuses = {
+                        entry["_id"]: entry["status"]
+                        for entry in self._request_collection.find(
+                            {"_id": {"$in": waiting_request_ids}},
+                            projection=["status"],
+                        )  # DB_ACCESS_OUTSIDE_VIEW
+                    }
+                else:
+                    statuses = {}
+                for request_id, status in statuses.items():
                     if status == RequestStatus.FULFILLED.name:
                         self._handle_fulfilled_request(request_id=request_id)
                     elif status == RequestStatus.ERROR.name:
@@ -6,6 +6,7 @@ saving samples to the completed database.
 import time
 
 from bson import ObjectId  # type: ignore
+from pymongo import ReplaceOne
 
 from alab_management.utils.data_objects import get_collection, get_completed_collection
 
@@ -48,6 +49,31 @@ class CompletedSampleView:
             ):
                 time.sleep(0.5)
 
+    def save_samples(self, sample_ids: list[ObjectId]):
+        """
+        Save a batch of samples to the completed database in one bulk write,
+        instead of a fetch + existence check + write per sample.
+        """
+        if not sample_ids:
+            return
+        sample_ids = [ObjectId(sample_id) for sample_id in sample_ids]
+        sample_dicts = list(
+            self._working_sample_collection.find({"_id": {"$in": sample_ids}})
+        )
+        if len(sample_dicts) != len(set(sample_ids)):
+            missing = set(sample_ids) - {
+                sample_dict["_id"] for sample_dict in sample_dicts
+            }
+            raise ValueError(
+                f"Samples with ids {sorted(missing, key=str)} do not exist in the database!"
+            )
+        self._completed_sample_collection.bulk_write(
+            [
+                ReplaceOne({"_id": sample_dict["_id"]}, sample_dict, upsert=True)
+                for sample_dict in sample_dicts
+            ]
+        )
+
     def exists(self, sample_id: ObjectId | str) -> bool:
         """Check if a sample exists in the database.
 
@@ -7,7 +7,7 @@ from typing import Any, ClassVar
 from bson import ObjectId  # type: ignore
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sample:
     """
     Basic sample object.
@@ -27,7 +27,7 @@ class Sample:
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SamplePosition:
     """
     A sample position in the lab.
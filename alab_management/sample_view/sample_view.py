@@ -4,6 +4,7 @@ import re
 import time
 from datetime import datetime
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Any, cast
 
 import pymongo  # type: ignore
@@ -14,6 +15,21 @@ from alab_management.utils.data_objects import get_collection, get_lock
 
 from .sample import Sample, SamplePosition
 
+# characters that cannot appear in sample / sample position names because
+# they have special meaning in MongoDB field paths
+_ILLEGAL_NAME_PATTERN = re.compile(r"[$.]")
+
+
+@lru_cache(maxsize=256)
+def _prefix_regex(prefix: str) -> str:
+    """Anchored, escaped ``$regex`` string matching names that start with *prefix*.
+
+    The prefixes used by the resource manager come from a small fixed set of
+    sample positions, so caching avoids re-escaping the same string on every
+    availability check.
+    """
+    return f"^{re.escape(prefix)}"
+
 
 class SamplePositionRequest(BaseModel):
     """
@@ -100,7 +116,7 @@ class SampleView:
                 if parent_device_name:
                     name = f"{parent_device_name}{SamplePosition.SEPARATOR}{name}"
 
-                if re.search(r"[$.]", name) is not None:
+                if _ILLEGAL_NAME_PATTERN.search(name) is not None:
                     raise ValueError(
                         f"Unsupported sample position name: {name}. "
                         f"Sample position name should not contain '.' or '$'"
@@ -136,6 +152,11 @@ class SampleView:
               The sample position name is actually the prefix of a sample position, which we
               will try to match all the sample positions will the name
         """
+        if not sample_positions:
+            # nothing to allocate (e.g. a task that only needs devices);
+            # skip the count checks and the distributed lock entirely
+            return {}
+
         sample_positions_request: list[SamplePositionRequest] = [
             (
                 SamplePositionRequest.from_py_type(sample_position)
@@ -153,7 +174,7 @@ class SampleView:
         # check if there are enough positions
         for sample_position in sample_positions_request:
             count = self._sample_positions_collection.count_documents(
-                {"name": {"$regex": f"^{re.escape(sample_position.prefix)}"}}
+                {"name": {"$regex": _prefix_regex(sample_position.prefix)}}
             )
             if count < sample_position.number:
                 raise ValueError(
@@ -263,37 +284,61 @@ class SampleView:
         """
         if (
             self._sample_positions_collection.find_one(
-                {"name": {"$regex": f"^{re.escape(position_prefix)}"}}
+                {"name": {"$regex": _prefix_regex(position_prefix)}}
             )
             is None
         ):
             raise ValueError(f"Cannot find device with prefix: {position_prefix}")
 
-        available_sample_positions = self._sample_positions_collection.find(
-            {
-                "name": {"$regex": f"^{re.escape(position_prefix)}"},
-                "$or": [
-                    {
-                        "task_id": None,
-                    },
-                    {
-                        "task_id": task_id,
-                    },
-                ],
-            }
+        available_sample_positions = list(
+            self._sample_positions_collection.find(
+                {
+                    "name": {"$regex": _prefix_regex(position_prefix)},
+                    "$or": [
+                        {
+                            "task_id": None,
+                        },
+                        {
+                            "task_id": task_id,
+                        },
+                    ],
+                },
+                projection=["name", "task_id"],
+            )
         )
+        # look up the samples sitting on all candidate positions in one query
+        # instead of re-querying the status of each position individually
+        occupying_sample_task_ids = {
+            sample["position"]: sample["task_id"]
+            for sample in self._sample_collection.find(
+                {
+                    "position": {
+                        "$in": [
+                            sample_position["name"]
+                            for sample_position in available_sample_positions
+                        ]
+                    }
+                },
+                projection=["position", "task_id"],
+            )
+        }
         available_sp_names = []
         for sample_position in available_sample_positions:
-            status, current_task_id = self.get_sample_position_status(
-                sample_position["name"]
+            name = sample_position["name"]
+            if name in occupying_sample_task_ids:
+                # the position is occupied by a sample; it is only usable
+                # if that sample belongs to the requesting task
+                if occupying_sample_task_ids[name] != task_id:
+                    continue
+            elif sample_position["task_id"] not in (None, task_id):
+                # locked by another task
+                continue
+            available_sp_names.append(
+                {
+                    "name": name,
+                    "need_release": sample_position["task_id"] != task_id,
+                }
             )
-            if status is SamplePositionStatus.EMPTY or task_id == current_task_id:
-                available_sp_names.append(
-                    {
-                        "name": sample_position["name"],
-                        "need_release": self.get_sample_position(sample_position["name"])["task_id"] != task_id,  # type: ignore
-                    }
-                )
         return available_sp_names
 
     def lock_sample_position(self, task_id: ObjectId, position: str):
@@ -320,6 +365,51 @@ class SampleView:
         while not self.is_locked_position(position):
             time.sleep(0.5)
 
+    def lock_sample_positions(self, task_id: ObjectId, positions: list[str]):
+        """
+        Lock a list of sample positions for one task.
+
+        All the positions are validated up front and then locked with a single
+        update, instead of one validation + update round trip per position.
+        """
+        if not positions:
+            return
+
+        position_entries = {
+            entry["name"]: entry
+            for entry in self._sample_positions_collection.find(
+                {"name": {"$in": positions}}, projection=["name", "task_id"]
+            )
+        }
+        for position in positions:
+            if position not in position_entries:
+                raise ValueError(f"Invalid sample position: {position}")
+
+        occupying_sample_task_ids = {
+            sample["position"]: sample["task_id"]
+            for sample in self._sample_collection.find(
+                {"position": {"$in": positions}}, projection=["position", "task_id"]
+            )
+        }
+        for position in positions:
+            if position in occupying_sample_task_ids:
+                if occupying_sample_task_ids[position] != task_id:
+                    raise ValueError(f"Position ({position}) is currently occupied")
+            elif position_entries[position]["task_id"] not in (None, task_id):
+                raise ValueError(
+                    f"Position is currently locked by task: "
+                    f"{position_entries[position]['task_id']}"
+                )
+
+        self._sample_positions_collection.update_many(
+            {"name": {"$in": positions}},
+            {
+                "$set": {
+                    "task_id": task_id,
+                }
+            },
+        )
+
     def release_sample_position(self, position: str):
         """Unlock a sample position."""
         if self.get_sample_position(position) is None:
@@ -372,7 +462,7 @@ class SampleView:
             if not self.is_unoccupied_position(position):
                 raise ValueError(f"Requested position ({position}) is not EMPTY.")
 
-        if re.search(r"[.$]", name) is not None:
+        if _ILLEGAL_NAME_PATTERN.search(name) is not None:
             raise ValueError(
                 f"Unsupported sample name: {name}. "
                 f"Sample name should not contain '.' or '$'"
@@ -427,6 +517,36 @@ class SampleView:
             tags=result.get("tags", []),
         )
 
+    def get_samples(self, sample_ids: list[ObjectId]) -> dict[ObjectId, Sample]:
+        """Get multiple samples by their ids with a single query.
+
+        Args:
+            sample_ids (list[ObjectId]): ids of the samples within sample collection
+
+        Raises
+        ------
+            ValueError: one or more of the ids has no matching sample
+
+        Returns
+        -------
+            dict[ObjectId, Sample]: a dict mapping each id to its Sample object
+        """
+        samples = {
+            result["_id"]: Sample(
+                sample_id=result["_id"],
+                name=result["name"],
+                position=result["position"],
+                task_id=result["task_id"],
+                metadata=result.get("metadata", {}),
+                tags=result.get("tags", []),
+            )
+            for result in self._sample_collection.find({"_id": {"$in": sample_ids}})
+        }
+        missing = [sample_id for sample_id in sample_ids if sample_id not in samples]
+        if missing:
+            raise ValueError(f"No sample found with id: {missing[0]}")
+        return samples
+
     def update_sample_task_id(self, sample_id: ObjectId, task_id: ObjectId | None):
         """Update the task id for a sample."""
         result = self._sample_collection.find_one({"_id": sample_id})
@@ -443,6 +563,25 @@ class SampleView:
             },
         )
 
+    def update_sample_task_ids(
+        self, sample_ids: list[ObjectId], task_id: ObjectId | None
+    ):
+        """Update the task id for a list of samples with a single update."""
+        if not sample_ids:
+            return
+
+        result = self._sample_collection.update_many(
+            {"_id": {"$in": sample_ids}},
+            {
+                "$set": {
+                    "task_id": task_id,
+                    "last_updated": datetime.now(),
+                }
+            },
+        )
+        if result.matched_count != len(set(sample_ids)):
+            raise ValueError(f"Cannot find all samples with ids: {sample_ids}")
+
     def update_sample_metadata(self, sample_id: ObjectId, metadata: dict[str, Any]):
         """Update the metadata for a sample. This adds new metadata or updates existing metadata."""
         result = self._sample_collection.find_one({"_id": sample_id})
@@ -494,12 +633,18 @@ class SampleView:
         all_samples = {}
         for sample in samples:
             # remove the suffix of the sample position (e.g. remove /1, /2, etc.)
-            position_name = re.sub(
-                f"{SamplePosition.SEPARATOR}\\d+$", "", sample["position"]
-            )
+            # with a plain string split, which is cheaper than a regex sub here
+            head, sep, tail = sample["position"].rpartition(SamplePosition.SEPARATOR)
+            position_name = head if sep and tail.isdigit() else sample["position"]
             all_samples.setdefault(position_name, []).append(sample["_id"])
         return all_samples
 
+    def count_samples_on_device(self, device_name: str) -> int:
+        """Count the number of samples on a device without fetching the sample documents."""
+        return self._sample_collection.count_documents(
+            {"position": {"$regex": f"^{device_name}{SamplePosition.SEPARATOR}"}}
+        )
+
     def exists(self, sample_id: ObjectId | str) -> bool:
         """Check if a sample exists in the database.
 
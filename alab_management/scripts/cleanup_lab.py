@@ -44,11 +44,9 @@ def cleanup_lab(
                 f"{config['general']['name']}_sim:  "
             )
             print(f"Removing database {database_name}")
-            _GetMongoCollection.init()
             _GetMongoCollection.client.drop_database(database_name)  # type: ignore
         else:
             print(f"Removing database {database_name}")
-            _GetMongoCollection.init()
             _GetMongoCollection.client.drop_database(database_name)
 
         # if sim_mode != AlabOSConfig().is_sim_mode() or database_name == "Alab":
@@ -161,25 +161,24 @@ def launch_lab(host, port, debug):
 
     package_fingerprint = calculate_package_hash()
 
-    counter = 0
+    monitored_threads = [
+        (experiment_manager_thread, 1001),
+        (task_launcher_thread, 1002),
+        (dashboard_thread, 1003),
+        (device_manager_thread, 1004),
+        (resource_manager_thread, 1005),
+    ]
+    refresh_interval = 30  # seconds between system_refresh checks
+    join_timeout = 0.3  # per-thread, keeps crash detection within ~1.5s overall
+    next_refresh = time.monotonic() + refresh_interval
     while True:
-        time.sleep(1.5)
-        if not experiment_manager_thread.is_alive():
-            sys.exit(1001)
-
-        if not task_launcher_thread.is_alive():
-            sys.exit(1002)
-
-        if not dashboard_thread.is_alive():
-            sys.exit(1003)
-
-        if not device_manager_thread.is_alive():
-            sys.exit(1004)
-
-        if not resource_manager_thread.is_alive():
-            sys.exit(1005)
-
-        counter += 1
-        if counter % 20 == 0:  # check every 30 s
+        for thread, exit_code in monitored_threads:
+            # join only unblocks early for the thread currently being joined,
+            # so keep the per-thread timeout short: a crash anywhere is then
+            # noticed within one sweep over the threads
+            thread.join(timeout=join_timeout)
+            if not thread.is_alive():
+                sys.exit(exit_code)
+        if time.monotonic() >= next_refresh:
             system_refresh()
-            counter = 0
+            next_refresh = time.monotonic() + refresh_interval
@@ -128,10 +128,10 @@ def run_task(task_id_str: str):
 
     try:
         task_view.update_status(task_id=task_id, status=TaskStatus.RUNNING)
-        for sample in task_entry["samples"]:
-            sample_view.update_sample_task_id(
-                task_id=task_id, sample_id=sample["sample_id"]
-            )
+        sample_view.update_sample_task_ids(
+            task_id=task_id,
+            sample_ids=[sample["sample_id"] for sample in task_entry["samples"]],
+        )
         logger.system_log(
             level="INFO",
             log_data={
@@ -197,13 +197,11 @@ def run_task(task_id_str: str):
             # assume that all field are replaced by the value if the result is a pydantic model
             # convert pydantic model to dict
             dict_result = result.model_dump(mode="python")
-            for key, value in dict_result.items():
-                task_view.update_result(task_id=task_id, name=key, value=value)
+            task_view.update_results(task_id=task_id, results=dict_result)
         elif isinstance(result, dict):
-            for key, value in result.items():
-                # we do this per item to avoid overwriting existing results. Its possible that some results were
-                # uploaded mid-task under different keys using lab_view.update_result()
-                task_view.update_result(task_id=task_id, name=key, value=value)
+            # we write per-key (in a single update) to avoid overwriting existing results. Its possible that some
+            # results were uploaded mid-task under different keys using lab_view.update_result()
+            task_view.update_results(task_id=task_id, results=result)
         else:
             task_view.update_result(
                 task_id=task_id, name=None, value=result
@@ -244,8 +242,8 @@ def run_task(task_id_str: str):
         )
         cli_logger.info(f"Task {task_type} ({task_id}) completed successfully.")
     finally:
-        for sample in task_entry["samples"]:
-            sample_view.update_sample_task_id(
-                task_id=None, sample_id=sample["sample_id"]
-            )
+        sample_view.update_sample_task_ids(
+            task_id=None,
+            sample_ids=[sample["sample_id"] for sample in task_entry["samples"]],
+        )
         task_view.update_status(task_id=task_id, status=task_status)
@@ -19,6 +19,10 @@ from alab_management.utils.module_ops import load_definition
 cli_logger = logging.getLogger(__name__)
 set_up_rich_handler(cli_logger)
 
+# cap how many ready tasks are materialized and submitted per pass, so a huge
+# backlog does not balloon memory in a single loop iteration
+READY_TASK_BATCH_SIZE = 100
+
 
 class TaskManager:
     """
@@ -34,6 +38,9 @@ class TaskManager:
 
         self.logger = DBLogger(task_id=None)
         self._pause_new_task_launching = False
+        # resolved lazily (the task_actor import is deferred to avoid a cycle)
+        # and cached, so the submit loop does not re-import per pass
+        self._run_task_actor = None
         super().__init__()
         time.sleep(1)  # allow some time for other modules to launch
 
@@ -50,8 +57,7 @@ class TaskManager:
 
     def check_number_of_running_tasks(self) -> int:
         """Check the number of running tasks."""
-        running_tasks = self.task_view.get_tasks_by_status(TaskStatus.RUNNING)
-        return len(running_tasks)
+        return self.task_view.count_tasks_by_status(TaskStatus.RUNNING)
 
     def refresh_tasks(self):
         """Refresh the tasks in the task view."""
@@ -62,13 +68,17 @@ class TaskManager:
     def run(self):
         """Start the loop."""
         while True:
-            self._loop()
-            time.sleep(1)
-
-    def _loop(self):
-        self.handle_tasks_to_be_canceled()
+            handled_any = self._loop()
+            # only back off when the last pass was idle, so a batch of ready
+            # tasks is submitted without a sleep between each pass
+            if not handled_any:
+                time.sleep(1)
+
+    def _loop(self) -> bool:
+        handled_any = self.handle_tasks_to_be_canceled()
         if not self._pause_new_task_launching:
-            self.submit_ready_tasks()
+            handled_any = self.submit_ready_tasks() or handled_any
+        return handled_any
 
     def clean_up_tasks_from_previous_runs(self):
         """Cleans up incomplete tasks that exist from the last time the taskmanager was running. Note that this will
@@ -91,10 +101,11 @@ class TaskManager:
         for status in statuses_to_restart:
             tasks_to_restart += self.task_view.get_tasks_by_status(status)
 
-        for task in tasks_to_restart:
-            self.task_view.update_status(
-                task_id=task["task_id"], status=TaskStatus.READY
-            )
+        # re-queue all of them with one bulk write instead of a write per task
+        self.task_view.update_statuses(
+            task_ids=[task["task_id"] for task in tasks_to_restart],
+            status=TaskStatus.READY,
+        )
 
         if len(tasks_to_cancel) == 0:
             print("No dangling tasks found from previous alabos workers. Nice!")
@@ -131,15 +142,30 @@ class TaskManager:
 
         print("Cleanup is done, nice job. Lets get back to work!")
 
-    def submit_ready_tasks(self):
+    def submit_ready_tasks(self) -> bool:
         """
         Checking if there are any tasks that are ready to be submitted. (STATUS = READY)
         If so, submit them to task actor (dramatiq worker).
+
+        Returns whether any task was submitted.
         """
-        from alab_management.task_actor import run_task
+        if self._run_task_actor is None:
+            from alab_management.task_actor import run_task
 
-        ready_task_entries = self.task_view.get_ready_tasks()
+            self._run_task_actor = run_task
+
+        ready_task_entries = self.task_view.get_ready_tasks(
+            limit=READY_TASK_BATCH_SIZE
+        )
+        submitted_any = False
         for task_entry in ready_task_entries:
+            # atomically claim the task; if another task manager grabbed it
+            # first, skip it instead of double-submitting
+            if not self.task_view.try_to_claim_ready_task(
+                task_id=task_entry["task_id"]
+            ):
+                continue
+            submitted_any = True
             self.logger.system_log(
                 level="DEBUG",
                 log_data={
@@ -148,10 +174,7 @@ class TaskManager:
                     "task_id": task_entry["task_id"],
                 },
             )
-            self.task_view.update_status(
-                task_id=task_entry["task_id"], status=TaskStatus.INITIATED
-            )
-            result = run_task.send_with_options(
+            result = self._run_task_actor.send_with_options(
                 kwargs={"task_id_str": str(task_entry["task_id"])}
             )
             message_id = result.message_id
@@ -163,13 +186,18 @@ class TaskManager:
             self.task_view.set_task_actor_id(
                 task_id=task_entry["task_id"], message_id=message_id
             )
+        return submitted_any
 
-    def handle_tasks_to_be_canceled(self):
-        """Check if there are any tasks needs to be stopped."""
+    def handle_tasks_to_be_canceled(self) -> bool:
+        """Check if there are any tasks needs to be stopped.
+
+        Returns whether any cancellation was processed.
+        """
         tasks_to_be_cancelled = self.task_view.get_tasks_to_be_canceled(
             CancelingProgress.PENDING
         )
 
+        handled_any = False
         for task_entry in tasks_to_be_cancelled:
             self.logger.system_log(
                 level="DEBUG",
@@ -188,10 +216,14 @@ class TaskManager:
                     f"Task {task_entry['type']} ({task_entry['task_id']}) is being cancelled. "
                     f"Task Actor message_id: {message_id}"
                 )
-                self.task_view.update_canceling_progress(
-                    task_id=task_entry["task_id"],
-                    canceling_progress=CancelingProgress.WORKER_NOTIFIED,
-                    original_progress=CancelingProgress[
-                        task_entry["canceling_progress"]
-                    ],
+                handled_any = (
+                    self.task_view.update_canceling_progress(
+                        task_id=task_entry["task_id"],
+                        canceling_progress=CancelingProgress.WORKER_NOTIFIED,
+                        original_progress=CancelingProgress[
+                            task_entry["canceling_progress"]
+                        ],
+                    )
+                    or handled_any
                 )
+        return handled_any
@@ -4,6 +4,7 @@ completed task database.
 """
 
 from bson import ObjectId
+from pymongo import ReplaceOne
 
 from alab_management.utils.data_objects import get_collection, get_completed_collection
 
@@ -39,6 +40,29 @@ class CompletedTaskView:
         else:
             self._completed_task_collection.insert_one(task_dict)
 
+    def save_tasks(self, task_ids: list[ObjectId]):
+        """
+        Save a batch of tasks to the completed database in one bulk write,
+        instead of a fetch + existence check + write per task.
+        """
+        if not task_ids:
+            return
+        task_ids = [ObjectId(task_id) for task_id in task_ids]
+        task_dicts = list(
+            self._working_task_collection.find({"_id": {"$in": task_ids}})
+        )
+        if len(task_dicts) != len(set(task_ids)):
+            missing = set(task_ids) - {task_dict["_id"] for task_dict in task_dicts}
+            raise ValueError(
+                f"Tasks with ids {sorted(missing, key=str)} do not exist in the database!"
+            )
+        self._completed_task_collection.bulk_write(
+            [
+                ReplaceOne({"_id": task_dict["_id"]}, task_dict, upsert=True)
+                for task_dict in task_dicts
+            ]
+        )
+
     def exists(self, task_id: ObjectId | str) -> bool:
         """
         Check if a task exists in the database.
@@ -1,9 +1,11 @@
 """Define the base class of task, which will be used for defining more tasks."""
 
+import hashlib
 import inspect
 import os
-import time
+import shutil
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from inspect import getfullargspec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -27,6 +29,35 @@ if TYPE_CHECKING:
 _UNSET = object()
 
 
+@lru_cache(maxsize=1)
+def _get_gridfs() -> gridfs.GridFS:
+    """
+    Return a process-wide GridFS handle.
+
+    Building a GridFS object sets up its files/chunks collection wrappers, so
+    constructing one per store/retrieve call is wasted work; the underlying
+    MongoClient is already shared and thread-safe.
+    """
+    return gridfs.GridFS(get_db())
+
+
+class _HashingReader:
+    """Wrap a binary file-like object and hash the bytes as they are read."""
+
+    def __init__(self, file_obj: Any):
+        self._file_obj = file_obj
+        self._hasher = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file_obj.read(size)
+        if chunk:
+            self._hasher.update(chunk)
+        return chunk
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
+
+
 class LargeResult(BaseModel):
     """
     A Pydantic model for a large result (file >16 MB).
@@ -46,6 +77,8 @@ class LargeResult(BaseModel):
     identifier: str | ObjectId | None = None
     # alternative to local path, used for uploading, local path has higher priority
     file_like_data: Any | None = None
+    # SHA-256 hex digest of the stored content, computed in-stream during store()
+    checksum: str | None = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -111,24 +144,26 @@ class LargeResult(BaseModel):
         This method should have a timeout regardless of the storage system to not block indefinitely.
         """
         if self.storage_type == "gridfs":
-            db = get_db()
-            fs = gridfs.GridFS(db)
+            fs = _get_gridfs()
+            # hash the content as gridfs consumes it, so the integrity
+            # checksum costs no extra pass over the data
             if self.local_path:
                 with open(self.local_path, "rb") as file:
-                    file_id = fs.put(file)
+                    reader = _HashingReader(file)
+                    file_id = fs.put(reader)
             elif self.file_like_data:
-                file_id = fs.put(self.file_like_data)
+                reader = _HashingReader(self.file_like_data)
+                file_id = fs.put(reader)
             else:
                 raise ValueError(
                     "Either local_path or serializable_data must be provided for storing in gridfs."
                 )
             self.identifier = file_id
-            # check if the file is stored, wait until it is stored for maximum 10 seconds
-            for _ in range(10):
-                if fs.exists(file_id):
-                    return
-                time.sleep(1)
-            raise ValueError(f"File with identifier {file_id} failed to be stored.")
+            self.checksum = reader.hexdigest()
+            # fs.put only returns once the chunks and the file document are
+            # acknowledged by the server (it raises on failure), so a
+            # follow-up existence check would just be an extra round trip
+            return
         raise ValueError("Only gridfs storage is supported for now.")
 
     def retrieve(self):
@@ -138,22 +173,66 @@ class LargeResult(BaseModel):
                 raise ValueError(
                     "Identifier is not provided for retrieving from gridfs."
                 )
-            db = get_db()
-            fs = gridfs.GridFS(db)
-            if fs.get(self.identifier) is None:
+            fs = _get_gridfs()
+            try:
+                # a single get: gridfs signals a missing file by raising
+                # NoFile, never by returning None, and the old pre-check
+                # fetched the file a second time
+                grid_out = fs.get(self.identifier)
+            except gridfs.errors.NoFile as exc:
                 raise ValueError(
                     f"File with identifier {self.identifier} does not exist."
+                ) from exc
+            return grid_out.read()
+        raise ValueError("Only gridfs storage is supported for now.")
+
+    def retrieve_file_like(self):
+        """
+        Retrieve the large result as a file-like object instead of loading the
+        whole payload into memory.
+
+        The returned handle supports ``read(size)`` and iteration by chunk, so
+        callers can stream multi-hundred-MB results to disk or over HTTP.
+        """
+        if self.storage_type == "gridfs":
+            if self.identifier is None:
+                raise ValueError(
+                    "Identifier is not provided for retrieving from gridfs."
                 )
-            return fs.get(self.identifier).read()
+            fs = _get_gridfs()
+            try:
+                return fs.get(self.identifier)
+            except gridfs.errors.NoFile as exc:
+                raise ValueError(
+                    f"File with identifier {self.identifier} does not exist."
+                ) from exc
         raise ValueError("Only gridfs storage is supported for now.")
 
+    def retrieve_to(self, sink) -> int:
+        """
+        Stream the large result into a caller-provided writable binary sink.
+
+        Unlike :py:meth:`retrieve`, this never materializes the whole payload
+        in memory, so callers can copy multi-hundred-MB results straight to
+        disk or an HTTP response.
+
+        Args:
+            sink: a writable binary file-like object (must have a ``write`` method)
+
+        Returns
+        -------
+            int: the number of bytes written to the sink
+        """
+        grid_out = self.retrieve_file_like()
+        shutil.copyfileobj(grid_out, sink)
+        return grid_out.length
+
     def check_if_stored(self):
         """Check if the large result is stored in the storage system."""
         if self.storage_type == "gridfs":
             if self.identifier is None:
                 return False
-            db = get_db()
-            fs = gridfs.GridFS(db)
+            fs = _get_gridfs()
             return fs.exists(self.identifier)
         raise ValueError("Only gridfs storage is supported for now.")
 
@@ -13,12 +13,42 @@ from alab_management.task_view.task import BaseTask, get_all_tasks
 from alab_management.task_view.task_enums import CancelingProgress, TaskStatus
 from alab_management.utils.data_objects import get_collection, make_bsonable
 
+# statuses in which a task can still be canceled, precomputed once instead of
+# being rebuilt for every cancellation query
+_CANCELABLE_STATUS_NAMES = [
+    TaskStatus.RUNNING.name,
+    TaskStatus.REQUESTING_RESOURCES.name,
+]
+
+# terminal statuses: a task in one of these will never change status again
+_FINISHED_STATUS_NAMES = [
+    TaskStatus.COMPLETED.name,
+    TaskStatus.ERROR.name,
+    TaskStatus.CANCELLED.name,
+]
+
 
 class TaskView:
     """Task view manages the status, parameters of a task."""
 
     def __init__(self):
         self._task_collection = get_collection("tasks")
+        # multikey indexes so that "which tasks depend on task X" lookups do not
+        # scan the whole collection
+        self._task_collection.create_index([("prev_tasks", 1)])
+        self._task_collection.create_index([("next_tasks", 1)])
+        # the managers constantly query by status (optionally sorted by age);
+        # this compound index covers both the filter and the FIFO sort
+        self._task_collection.create_index([("status", 1), ("created_at", 1)])
+        # multikey index into the embedded sample list, which backs
+        # get_task_with_sample
+        self._task_collection.create_index([("samples.sample_id", 1)])
+        # the cancellation scans only ever touch the few documents that carry
+        # a canceling_progress field; a partial index keeps it that small
+        self._task_collection.create_index(
+            [("canceling_progress", 1), ("status", 1)],
+            partialFilterExpression={"canceling_progress": {"$exists": True}},
+        )
         self._tasks_definition: dict[str, type[BaseTask]] = get_all_tasks()
         self.completed_task_view = CompletedTaskView()
 
@@ -60,6 +90,7 @@ class TaskView:
         for related_task_id in prev_tasks + next_tasks:
             self.get_task(task_id=related_task_id)  # will raise error if not found
 
+        now = datetime.now()
         entry = {
             "type": task_type,
             "status": TaskStatus.WAITING.name,
@@ -67,8 +98,8 @@ class TaskView:
             "parameters": parameters,
             "prev_tasks": prev_tasks,
             "next_tasks": next_tasks,
-            "created_at": datetime.now(),
-            "last_updated": datetime.now(),
+            "created_at": now,
+            "last_updated": now,
             "message": "",
         }
         if isinstance(task_id, ObjectId):
@@ -84,6 +115,7 @@ class TaskView:
         task = self.get_task(task_id=task_id)
         subtask_id = ObjectId()
 
+        now = datetime.now()
         subtasks = task.get("subtasks", [])
         subtasks.append(
             {
@@ -92,8 +124,8 @@ class TaskView:
                 "samples": samples,
                 "status": TaskStatus.INITIATED.name,
                 "parameters": parameters,
-                "created_at": datetime.now(),
-                "last_updated": datetime.now(),
+                "created_at": now,
+                "last_updated": now,
             }
         )
         self._task_collection.update_one(
@@ -101,7 +133,7 @@ class TaskView:
             {
                 "$set": {
                     "subtasks": subtasks,
-                    "last_updated": datetime.now(),
+                    "last_updated": now,
                 }
             },
         )
@@ -151,6 +183,82 @@ class TaskView:
         task = self.get_task(task_id=task_id)
         return TaskStatus[task["status"]]
 
+    def get_statuses(self, task_ids: list[ObjectId]) -> dict[ObjectId, TaskStatus]:
+        """
+        Get the statuses of multiple tasks in a single query.
+
+        Args:
+            task_ids: the ids of the tasks of interest
+
+        Returns
+        -------
+            a dict mapping each task id to its :py:class:`TaskStatus`
+        """
+        task_ids = [ObjectId(task_id) for task_id in task_ids]
+        statuses = {
+            task["_id"]: TaskStatus[task["status"]]
+            for task in self._task_collection.find(
+                {"_id": {"$in": task_ids}}, projection=["status"]
+            )
+        }
+        for task_id in task_ids:
+            if task_id not in statuses:
+                # fall back to a per-task lookup, which also covers tasks that
+                # have been moved to the completed collection
+                statuses[task_id] = self.get_status(task_id=task_id)
+        return statuses
+
+    def get_tasks(
+        self, task_ids: list[ObjectId], encode: bool = False
+    ) -> dict[ObjectId, dict[str, Any]]:
+        """
+        Get multiple tasks by their ids with a single query.
+
+        Tasks not found in the active collection are fetched from the
+        completed collection individually, which is the uncommon case.
+
+        Args:
+            task_ids: the task ids of interest
+            encode: whether to encode the tasks using ``self.encode_task`` method
+
+        Returns
+        -------
+            a dict mapping each task id to its task entry
+        """
+        task_ids = [ObjectId(task_id) for task_id in task_ids]
+        tasks = {
+            task["_id"]: task
+            for task in self._task_collection.find({"_id": {"$in": task_ids}})
+        }
+        for task_id in task_ids:
+            if task_id not in tasks:
+                tasks[task_id] = self.get_task(task_id=task_id, encode=False)
+        if encode:
+            tasks = {
+                task_id: self.encode_task(task) for task_id, task in tasks.items()
+            }
+        return tasks
+
+    def get_unfinished_task_ids(self, task_ids: list[ObjectId]) -> set[ObjectId]:
+        """
+        Return the ids among ``task_ids`` that are not yet in a terminal
+        status (COMPLETED, ERROR or CANCELLED), using a single query.
+
+        Tasks absent from the active collection have been moved to the
+        completed collection and therefore count as finished.
+        """
+        if not task_ids:
+            return set()
+        return set(
+            self._task_collection.distinct(
+                "_id",
+                {
+                    "_id": {"$in": [ObjectId(task_id) for task_id in task_ids]},
+                    "status": {"$nin": _FINISHED_STATUS_NAMES},
+                },
+            )
+        )
+
     def update_status(self, task_id: ObjectId, status: TaskStatus):
         """
         Update the status of one task.
@@ -164,14 +272,15 @@ class TaskView:
             status: the new status of the task
         """
         task = self.get_task(task_id=task_id, encode=False)
+        now = datetime.now()
         update_dict = {
             "status": status.name,
-            "last_updated": datetime.now(),
+            "last_updated": now,
         }
         if status == TaskStatus.RUNNING and "started_at" not in task:
-            update_dict["started_at"] = datetime.now()
+            update_dict["started_at"] = now
         elif status == TaskStatus.COMPLETED:
-            update_dict["completed_at"] = datetime.now()
+            update_dict["completed_at"] = now
 
         self._task_collection.update_one(
             {"_id": task_id},
@@ -180,8 +289,7 @@ class TaskView:
 
         if status is TaskStatus.COMPLETED:
             # try to figure out tasks that is READY
-            for next_task_id in task["next_tasks"]:
-                self.try_to_mark_task_ready(task_id=next_task_id)
+            self.try_to_mark_tasks_ready(task_ids=task["next_tasks"])
 
         if status in [TaskStatus.CANCELLED, TaskStatus.ERROR]:
             # any downstream tasks should be:
@@ -228,22 +336,49 @@ class TaskView:
                             task_id=next_task_id
                         )  # in case it was only waiting on task we just cancelled
 
+    def update_statuses(self, task_ids: list[ObjectId], status: TaskStatus):
+        """
+        Update the status of multiple tasks with a single update.
+
+        This is a plain bulk write: it skips the per-task bookkeeping that
+        :py:meth:`update_status` performs (readiness checks on next tasks,
+        cancellation propagation, timestamps like ``started_at``), so it is
+        only suitable for transitions without side effects, e.g. re-queueing
+        INITIATED tasks as READY on startup.
+
+        Args:
+            task_ids: the ids of tasks to be updated
+            status: the new status for all of the tasks
+        """
+        if not task_ids:
+            return
+        self._task_collection.update_many(
+            {"_id": {"$in": [ObjectId(task_id) for task_id in task_ids]}},
+            {
+                "$set": {
+                    "status": status.name,
+                    "last_updated": datetime.now(),
+                }
+            },
+        )
+
     def update_subtask_status(
         self, task_id: ObjectId, subtask_id: ObjectId, status: TaskStatus
     ):
         """Update the status of a subtask."""
         task = self.get_task(task_id=task_id, encode=False)
+        now = datetime.now()
         subtasks = task.get("subtasks", [])
         found = False
         for subtask in subtasks:
             if subtask["subtask_id"] == subtask_id:
                 found = True
                 subtask["status"] = status.name
-                subtask["last_updated"] = datetime.now()
+                subtask["last_updated"] = now
                 if status == TaskStatus.RUNNING and "started_at" not in subtask:
-                    subtask["started_at"] = datetime.now()
+                    subtask["started_at"] = now
                 elif status == TaskStatus.COMPLETED:
-                    subtask["completed_at"] = datetime.now()
+                    subtask["completed_at"] = now
                 break
         if not found:
             raise ValueError(
@@ -251,7 +386,7 @@ class TaskView:
             )
         self._task_collection.update_one(
             {"_id": task_id},
-            {"$set": {"subtasks": subtasks, "last_updated": datetime.now()}},
+            {"$set": {"subtasks": subtasks, "last_updated": now}},
         )
 
     def update_result(
@@ -283,6 +418,34 @@ class TaskView:
             },
         )
 
+    def update_results(self, task_id: ObjectId, results: dict[str, Any]):
+        """
+        Update several named results of a task with a single write.
+
+        Each key is stored under ``result.<name>``, like calling
+        :py:meth:`update_result` once per key but in one round trip; other
+        result keys already stored (e.g. uploaded mid-task) are untouched.
+
+        Args:
+            task_id: the id of task to be updated
+            results: a mapping of result name to value. The values must be
+                bson-encodable (i.e. can be written into MongoDB!)
+        """
+        if not results:
+            return
+        _ = self.get_task(
+            task_id=task_id
+        )  # just to confirm that task_id exists in collection
+
+        update_dict: dict[str, Any] = {
+            f"result.{name}": make_bsonable(value) for name, value in results.items()
+        }
+        update_dict["last_updated"] = datetime.now()
+        self._task_collection.update_one(
+            {"_id": task_id},
+            {"$set": update_dict},
+        )
+
     def update_subtask_result(
         self, task_id: ObjectId, subtask_id: ObjectId, result: Any
     ):
@@ -318,30 +481,123 @@ class TaskView:
             },
         )
 
+    def try_to_mark_tasks_ready(self, task_ids: list[ObjectId]):
+        """
+        Check a batch of tasks and mark the ones whose parent tasks are all
+        completed as READY.
+
+        This uses one query to fetch the waiting candidates and one query to
+        find their incomplete parents, instead of probing every task
+        individually.
+        """
+        if not task_ids:
+            return
+
+        candidates = list(
+            self._task_collection.find(
+                {"_id": {"$in": task_ids}, "status": TaskStatus.WAITING.name},
+                projection=["prev_tasks"],
+            )
+        )
+        if not candidates:
+            return
+
+        all_prev_task_ids = [
+            prev_task_id
+            for candidate in candidates
+            for prev_task_id in candidate["prev_tasks"]
+        ]
+        # tasks absent from the active collection have been moved to the
+        # completed collection, which only ever holds COMPLETED tasks
+        incomplete_prev_task_ids = {
+            task["_id"]
+            for task in self._task_collection.find(
+                {
+                    "_id": {"$in": all_prev_task_ids},
+                    "status": {"$ne": TaskStatus.COMPLETED.name},
+                },
+                projection=[],
+            )
+        }
+        for candidate in candidates:
+            if not any(
+                prev_task_id in incomplete_prev_task_ids
+                for prev_task_id in candidate["prev_tasks"]
+            ):
+                self.update_status(candidate["_id"], TaskStatus.READY)
+
     def try_to_mark_task_ready(self, task_id: ObjectId):
         """
         Check if one task's parent tasks are all completed,
         if so, mark it as READY.
         """
-        task = self.get_task(task_id)
+        # only the status and the parent list matter here, so fetch just those
+        # instead of the whole task document. A task that is not in the active
+        # collection cannot be WAITING, so there is no completed-collection
+        # fallback either.
+        task = self._task_collection.find_one(
+            {"_id": ObjectId(task_id)}, projection=["status", "prev_tasks"]
+        )
+
+        if task is None or task["status"] != TaskStatus.WAITING.name:
+            return
 
         prev_task_ids = task["prev_tasks"]
-        if task["status"] == TaskStatus.WAITING.name and all(
-            self.get_status(task_id=task_id_) is TaskStatus.COMPLETED
-            for task_id_ in prev_task_ids
-        ):
-            self.update_status(task_id, TaskStatus.READY)
+        if prev_task_ids:
+            # check all the parent statuses in one query instead of fetching
+            # each parent task individually. Tasks absent from the active
+            # collection have been moved to the completed collection, which
+            # only ever holds COMPLETED tasks.
+            incomplete_count = self._task_collection.count_documents(
+                {
+                    "_id": {"$in": prev_task_ids},
+                    "status": {"$ne": TaskStatus.COMPLETED.name},
+                }
+            )
+            if incomplete_count > 0:
+                return
+
+        self.update_status(task_id, TaskStatus.READY)
 
-    def get_ready_tasks(self) -> list[dict[str, Any]]:
+    def get_ready_tasks(self, limit: int | None = None) -> list[dict[str, Any]]:
         """
-        Return a list of ready tasks.
+        Return a list of ready tasks, oldest first.
+
+        Args:
+            limit: if given, return at most this many tasks; the rest are
+              picked up by later passes.
 
         Returns
         -------
             List of task entry: {"task_id": ``ObjectId``,
             "type": :py:class:`BaseTask <alab_management.task_view.task.BaseTask>`}
         """
-        return self.get_tasks_by_status(status=TaskStatus.READY)
+        # sort server-side so tasks are submitted to the workers in FIFO order
+        result = self._task_collection.find({"status": TaskStatus.READY.name}).sort(
+            "created_at", 1
+        )
+        if limit is not None:
+            result = result.limit(limit)
+        return [self.encode_task(task_entry) for task_entry in result]
+
+    def try_to_claim_ready_task(self, task_id: ObjectId) -> bool:
+        """
+        Atomically move a task from READY to INITIATED.
+
+        The status precondition is part of the update filter, so only one
+        caller can successfully claim a given ready task. Returns whether the
+        claim succeeded.
+        """
+        returned_value = self._task_collection.update_one(
+            {"_id": task_id, "status": TaskStatus.READY.name},
+            {
+                "$set": {
+                    "status": TaskStatus.INITIATED.name,
+                    "last_updated": datetime.now(),
+                }
+            },
+        )
+        return returned_value.modified_count == 1
 
     def get_tasks_by_status(self, status: TaskStatus) -> list[dict[str, Any]]:
         """
@@ -359,6 +615,10 @@ class TaskView:
             tasks.append(self.encode_task(task_entry))
         return tasks
 
+    def count_tasks_by_status(self, status: TaskStatus) -> int:
+        """Count the tasks with given status without fetching the task entries."""
+        return self._task_collection.count_documents({"status": status.name})
+
     def encode_task(self, task_entry: dict[str, Any]) -> dict[str, Any]:
         """
         Rename _id to task_id
@@ -450,12 +710,7 @@ class TaskView:
         entry = self._task_collection.find_one_and_update(
             {
                 "_id": task_id,
-                "status": {
-                    "$in": [
-                        TaskStatus.RUNNING.name,
-                        TaskStatus.REQUESTING_RESOURCES.name,
-                    ],
-                },
+                "status": {"$in": _CANCELABLE_STATUS_NAMES},
             },
             {
                 "$set": {
@@ -494,24 +749,42 @@ class TaskView:
             canceling_progress: the progress of the task being canceled.
                 If None, return all tasks that are in the process of being canceled.
         """
+        # only the fields the cancellation handlers actually read; no need to
+        # hydrate samples, parameters and results for every candidate task
+        projection = ["type", "status", "task_actor_id", "canceling_progress"]
         if canceling_progress is None:
             result = self._task_collection.find(
-                {"canceling_progress": {"$exists": True}}
+                {"canceling_progress": {"$exists": True}}, projection=projection
             )
         else:
             result = self._task_collection.find(
                 {
                     "canceling_progress": canceling_progress.name,
-                    "status": {
-                        "$in": [
-                            TaskStatus.RUNNING.name,
-                            TaskStatus.REQUESTING_RESOURCES.name,
-                        ],
-                    },
-                }
+                    "status": {"$in": _CANCELABLE_STATUS_NAMES},
+                },
+                projection=projection,
             )
         return [self.encode_task(task) for task in result]
 
+    def get_task_ids_to_be_canceled(
+        self, canceling_progress: CancelingProgress
+    ) -> set[ObjectId]:
+        """
+        Get only the ids of the tasks that are in the process of being canceled.
+
+        This is a cheaper alternative to :py:meth:`get_tasks_to_be_canceled`
+        for callers that just need to test membership.
+        """
+        return set(
+            self._task_collection.distinct(
+                "_id",
+                {
+                    "canceling_progress": canceling_progress.name,
+                    "status": {"$in": _CANCELABLE_STATUS_NAMES},
+                },
+            )
+        )
+
     def exists(self, task_id: ObjectId | str) -> bool:
         """Check if a task id exists."""
         return self._task_collection.find_one({"_id": ObjectId(task_id)}) is not None
@@ -13,8 +13,12 @@ from alab_management.utils.data_objects import get_collection
 from .config import AlabOSConfig
 
 
-class UserRequestStatus(Enum):
-    """Enum for user response."""
+class UserRequestStatus(str, Enum):
+    """Enum for user response.
+
+    Members are also plain strings, so they can be written to and compared
+    against the database values directly without going through ``.value``.
+    """
 
     FULLFILLED = "fulfilled"
     PENDING = "pending"
@@ -66,7 +70,7 @@ class UserInputView:
                 "_id": request_id,
                 "prompt": prompt,
                 "options": [str(opt) for opt in options],
-                "status": UserRequestStatus.PENDING.value,
+                "status": UserRequestStatus.PENDING,
                 "request_context": context,
                 "last_updated": datetime.now(),
             }
@@ -97,7 +101,7 @@ class UserInputView:
                 "$set": {
                     "response": response,
                     "note": note,
-                    "status": UserRequestStatus.FULLFILLED.value,
+                    "status": UserRequestStatus.FULLFILLED,
                     "last_updated": datetime.now(),
                 }
             },
@@ -121,7 +125,7 @@ class UserInputView:
                 time.sleep(0.5)
         except:  # noqa: E722
             self._input_collection.update_one(
-                {"_id": request_id}, {"$set": {"status": UserRequestStatus.ERROR.name}}
+                {"_id": request_id}, {"$set": {"status": UserRequestStatus.ERROR}}
             )
             raise
         return request["response"]
@@ -138,7 +142,7 @@ class UserInputView:
         """
         return cast(
             list[dict[str, Any]],
-            self._input_collection.find({"status": UserRequestStatus.PENDING.value}),
+            self._input_collection.find({"status": UserRequestStatus.PENDING}),
         )
 
     def retrieve_user_input_with_note(self, request_id: ObjectId) -> tuple[str, str]:
@@ -159,12 +163,25 @@ class UserInputView:
                 time.sleep(0.5)
         except:  # noqa: E722
             self._input_collection.update_one(
-                {"_id": request_id}, {"$set": {"status": UserRequestStatus.ERROR.name}}
+                {"_id": request_id}, {"$set": {"status": UserRequestStatus.ERROR}}
             )
             raise
         return request["response"], request["note"]
 
 
+# constructing a UserInputView builds a TaskView, an ExperimentView and an
+# Alarm; share one lazily-created instance across the module-level helpers
+# instead of rebuilding that stack on every request
+_user_input_view: UserInputView | None = None
+
+
+def _get_user_input_view() -> UserInputView:
+    global _user_input_view
+    if _user_input_view is None:
+        _user_input_view = UserInputView()
+    return _user_input_view
+
+
 def request_user_input(
     task_id: ObjectId | None,
     prompt: str,
@@ -185,7 +202,7 @@ def request_user_input(
     -------
         response (str): user response as string
     """
-    user_input_view = UserInputView()
+    user_input_view = _get_user_input_view()
     request_id = user_input_view.insert_request(
         task_id=task_id,
         prompt=prompt,
@@ -238,7 +255,7 @@ def request_user_input_with_note(
         response (str): user response as string
         note (str): note from the user
     """
-    user_input_view = UserInputView()
+    user_input_view = _get_user_input_view()
     request_id = user_input_view.insert_request(
         task_id=task_id,
         prompt=prompt,
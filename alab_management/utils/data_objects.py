@@ -5,6 +5,7 @@ import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -21,7 +22,8 @@ from alab_management.utils.db_lock import MongoLock
 class _BaseGetMongoCollection(ABC):
     client: pymongo.MongoClient | None = None
     db: database.Database | None = None
-    db_lock: MongoLock | None = None
+    # assigned lazily in get_lock so each subclass gets its own dict
+    db_locks: dict[str, MongoLock] | None = None
 
     @classmethod
     @abstractmethod
@@ -44,25 +46,32 @@ class _BaseGetMongoCollection(ABC):
 
     @classmethod
     def get_lock(cls, name: str) -> MongoLock:
-        if cls.db_lock is None:
-            cls.db_lock = MongoLock(collection=cls.get_collection("_lock"), name=name)
-        return cls.db_lock
+        # previously a single cached lock was returned regardless of name,
+        # so every caller shared the lock created by the first request
+        if cls.db_locks is None:
+            cls.db_locks = {}
+        if name not in cls.db_locks:
+            cls.db_locks[name] = MongoLock(
+                collection=cls.get_collection("_lock"), name=name
+            )
+        return cls.db_locks[name]
 
 
 class _GetMongoCollection(_BaseGetMongoCollection):
     @classmethod
     def init(cls):
-        db_config = AlabOSConfig()["mongodb"]
+        alabos_config = AlabOSConfig()
+        db_config = alabos_config["mongodb"]
         cls.client = pymongo.MongoClient(
             host=db_config.get("host", None),
             port=db_config.get("port", None),
             username=db_config.get("username", ""),
             password=db_config.get("password", ""),
         )
-        sim_mode_flag = AlabOSConfig().is_sim_mode()
+        sim_mode_flag = alabos_config.is_sim_mode()
         # force to enable sim mode, just in case
         cls.db = cls.client[
-            AlabOSConfig()["general"]["name"] + ("_sim" * sim_mode_flag)
+            alabos_config["general"]["name"] + ("_sim" * sim_mode_flag)
         ]
 
 
@@ -82,13 +91,13 @@ class _GetCompletedMongoCollection(_BaseGetMongoCollection):
             username=db_config.get("username", ""),
             password=db_config.get("password", ""),
         )
-        sim_mode_flag = AlabOSConfig().is_sim_mode()
+        sim_mode_flag = alabos_config.is_sim_mode()
         if sim_mode_flag:
             cls.db = cls.client[
-                AlabOSConfig()["general"]["name"] + "(completed)" + "_sim"
+                alabos_config["general"]["name"] + "(completed)" + "_sim"
             ]
         else:
-            cls.db = cls.client[AlabOSConfig()["general"]["name"] + "(completed)"]
+            cls.db = cls.client[alabos_config["general"]["name"] + "(completed)"]
         # type: ignore # pylint: disable=unsubscriptable-object
 
 
@@ -107,8 +116,13 @@ def get_rabbitmq_connection():
     return _connection
 
 
+@lru_cache(maxsize=1)
 def get_rabbitmq_broker():
-    """Get a RabbitMQ broker connection for Dramatiq."""
+    """Get a RabbitMQ broker connection for Dramatiq.
+
+    The broker is cached so every caller in a process shares one broker (and
+    its connection pool) instead of opening a new set of connections.
+    """
     from dramatiq.brokers.rabbitmq import RabbitmqBroker
 
     rabbit_mq_config = AlabOSConfig()["rabbitmq"]
@@ -127,6 +141,10 @@ def make_bsonable(obj):
     Sanitize the object to make it bsonable. This is a recursive function, it will
     convert all the objects in the object to bsonable objects.
     """
+    # fast path: these are already bsonable as-is, and they make up the bulk
+    # of real payloads (numeric telemetry, timestamps, ids)
+    if obj is None or isinstance(obj, (bool, int, float, datetime, ObjectId)):
+        return obj
     if isinstance(obj, dict):
         obj = {str(key): make_bsonable(value) for key, value in obj.items()}
     elif isinstance(obj, list):
@@ -175,11 +193,54 @@ class ALabJSONEncoder(json.JSONEncoder):
             return super().default(z)
 
 
+def _make_jsonable_key(key):
+    """Convert a dict key the same way json.dumps would: int, float, bool and
+    None keys become strings, any other type is rejected with a TypeError.
+    """
+    if isinstance(key, str):
+        return key
+    # bools are int subclasses, so they must be handled first
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
+
 def make_jsonable(obj):
     """Converts a Python object to a JSON serializable object. Handles some typical ALab types (ObjectId, Enums,
     Numpy arrays, etc.) that are not JSON serializable by default. This is mostly used in API calls.
+
+    The conversion is done natively instead of encoding to a JSON string and
+    parsing it back, which doubled the serialization work for every API response.
     """
-    return json.loads(ALabJSONEncoder().encode(obj))
+    if obj is None or isinstance(obj, (str, int, float, bool)):
+        return obj
+    if isinstance(obj, dict):
+        return {
+            _make_jsonable_key(key): make_jsonable(value) for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [make_jsonable(item) for item in obj]
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, np.ndarray):
+        return make_jsonable(obj.tolist())
+    if isinstance(obj, np.int64):
+        return int(obj)
+    if isinstance(obj, np.float64):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return make_jsonable(obj.value)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 get_collection = _GetMongoCollection.get_collection
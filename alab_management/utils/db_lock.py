@@ -36,8 +36,10 @@ class MongoLock:
 
     def acquire(self, timeout: float | None = None):
         """Acquire the lock."""
-        start_time = time.time()
-        while timeout is None or time.time() - start_time <= timeout:
+        # monotonic clock: wall-clock adjustments (NTP, DST) must not extend
+        # or cut short the timeout window
+        start_time = time.monotonic()
+        while timeout is None or time.monotonic() - start_time <= timeout:
             try:
                 self._lock_collection.insert_one({"_id": self._name})
             except DuplicateKeyError:
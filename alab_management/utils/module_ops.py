@@ -14,6 +14,30 @@ from types import ModuleType
 
 import_lock = threading.RLock()
 
+# remembers which definition folders have already been imported (and under
+# which module name), so repeated load_definition calls can skip the path
+# resolution and package walk once the module is in sys.modules
+_definition_module_names: dict[Path, str] = {}
+
+# per-file digests keyed by path, so the periodic package-hash check only
+# re-reads files whose mtime or size changed since the last scan
+_file_digest_cache: dict[Path, tuple[int, int, bytes]] = {}
+
+
+def _file_digest(filepath: Path) -> bytes:
+    stat = filepath.stat()
+    cached = _file_digest_cache.get(filepath)
+    if (
+        cached is not None
+        and cached[0] == stat.st_mtime_ns
+        and cached[1] == stat.st_size
+    ):
+        return cached[2]
+    with open(filepath, "rb") as f:
+        digest = hashlib.sha256(f.read()).digest()
+    _file_digest_cache[filepath] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
+
 
 def hash_python_files_in_folder(folder_path: str | Path, file_exts=(".py",)):
     """
@@ -45,12 +69,10 @@ def hash_python_files_in_folder(folder_path: str | Path, file_exts=(".py",)):
     hash_obj = hashlib.sha256()
 
     for filepath in source_files:
-        with open(filepath, "rb") as f:
-            content = f.read()
-            hash_obj.update(
-                str(filepath.relative_to(folder)).encode("utf-8")
-            )  # relative path
-            hash_obj.update(content)
+        hash_obj.update(
+            str(filepath.relative_to(folder)).encode("utf-8")
+        )  # relative path
+        hash_obj.update(_file_digest(filepath))
 
     return hash_obj.hexdigest()
 
@@ -131,7 +153,13 @@ def load_definition(reload: bool = False) -> None:
         else config.path.parent / dir_to_import_from
     )
 
-    import_module_from_path(dir_to_import_from, reload=reload)
+    if not reload:
+        module_name = _definition_module_names.get(dir_to_import_from)
+        if module_name is not None and module_name in sys.modules:
+            return
+
+    module = import_module_from_path(dir_to_import_from, reload=reload)
+    _definition_module_names[dir_to_import_from] = module.__name__
 
 
 def calculate_package_hash():
@@ -0,0 +1,78 @@
+import json
+import unittest
+from datetime import datetime
+from enum import Enum
+
+import numpy as np
+from bson import ObjectId
+
+from alab_management.utils.data_objects import ALabJSONEncoder, make_jsonable
+
+
+class _Color(Enum):
+    RED = "red"
+    GREEN = 2
+
+
+class TestMakeJsonable(unittest.TestCase):
+    """Unit tests pinning the native make_jsonable converter to the output of
+    the original implementation (encode with ALabJSONEncoder, parse back)."""
+
+    def assert_parity(self, obj):
+        """Assert that make_jsonable matches a dumps/loads round trip."""
+        expected = json.loads(json.dumps(obj, cls=ALabJSONEncoder))
+        self.assertEqual(make_jsonable(obj), expected)
+
+    def test_primitives(self):
+        """Primitive values pass through unchanged."""
+        for obj in [None, True, False, 0, -3, 1.5, "text", ""]:
+            self.assert_parity(obj)
+
+    def test_alab_types(self):
+        """ObjectId, datetime and Enum values convert like the old encoder."""
+        self.assert_parity(ObjectId("0" * 24))
+        self.assert_parity(datetime(2024, 1, 2, 3, 4, 5))
+        self.assert_parity(_Color.RED)
+        self.assert_parity(_Color.GREEN)
+
+    def test_numpy_types(self):
+        """Numpy scalars become Python scalars, arrays become nested lists."""
+        self.assert_parity(np.int64(7))
+        self.assert_parity(np.float64(1.25))
+        self.assert_parity(np.array([[1, 2], [3, 4]]))
+
+    def test_nested_containers(self):
+        """Conversion recurses through dicts, lists and tuples."""
+        self.assert_parity(
+            {
+                "ids": [ObjectId("f" * 24), ObjectId("a" * 24)],
+                "when": datetime(2023, 12, 31, 23, 59),
+                "matrix": np.arange(4).reshape(2, 2),
+                "inner": {"status": _Color.RED, "values": (1, 2.5, None)},
+            }
+        )
+
+    def test_non_string_keys(self):
+        """int/float/bool/None keys become strings, exactly like json.dumps."""
+        self.assert_parity({1: "a"})
+        self.assert_parity({2.5: "b"})
+        self.assert_parity({True: "c"})
+        self.assert_parity({False: "d"})
+        self.assert_parity({None: "e"})
+
+    def test_unsupported_keys_raise(self):
+        """Keys that json.dumps rejects are rejected here too."""
+        for key in [datetime(2024, 1, 1), ObjectId("0" * 24), (1, 2)]:
+            with self.assertRaises(TypeError):
+                json.dumps({key: 1}, cls=ALabJSONEncoder)
+            with self.assertRaises(TypeError):
+                make_jsonable({key: 1})
+
+    def test_unsupported_values_raise(self):
+        """Values with no JSON representation raise TypeError."""
+        with self.assertRaises(TypeError):
+            make_jsonable(object())
+
+
+if __name__ == "__main__":
+    unittest.main()